@@ -0,0 +1,52 @@
+import os
+import tracemalloc
+
+import pytest
+
+import week3
+
+
+def test_read_run_does_not_keep_yielded_records(tmp_path):
+    records = week3.generate_random_patients(20000)
+    path, _ = week3._sort_run(records, "last_name", str(tmp_path))
+    del records
+    tracemalloc.start()
+    try:
+        reader = week3._read_run(path)
+        for _ in range(19000):
+            next(reader)
+        held, _ = tracemalloc.get_traced_memory()
+        reader.close()
+    finally:
+        tracemalloc.stop()
+    # a memo shared across loads would hold all 19000 records here (several MB)
+    assert held < 512 * 1024
+
+
+def test_external_sort_matches_sorted(tmp_path):
+    records = week3.generate_random_patients(2000)
+    out = list(week3.PatientRecord([]).external_sort("last_name", records, chunk_size=300,
+                                                      workers=2, tmpdir=str(tmp_path)))
+    assert out == sorted(records, key=lambda record: record["last_name"])
+    assert os.listdir(tmp_path) == []
+
+
+def test_external_sort_early_stop_removes_runs(tmp_path):
+    records = week3.generate_random_patients(2000)
+    stream = week3.PatientRecord([]).external_sort("last_name", records, chunk_size=300,
+                                                    workers=2, tmpdir=str(tmp_path))
+    next(stream)
+    stream.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_external_sort_error_removes_runs(tmp_path):
+    def failing():
+        yield from week3.generate_random_patients(1000)
+        raise RuntimeError("input failed")
+
+    stream = week3.PatientRecord([]).external_sort("last_name", failing(), chunk_size=100,
+                                                    workers=2, tmpdir=str(tmp_path))
+    with pytest.raises(RuntimeError):
+        list(stream)
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,117 @@
+import collections
+import random
+
+import pytest
+
+import week4
+import week6
+
+
+def fibonacci_data(count):
+    # Fibonacci frequencies give the most skewed Huffman tree: code lengths up to count - 1
+    a, b = 1, 1
+    data = bytearray()
+    for sym in range(count):
+        data.extend(bytes([sym]) * a)
+        a, b = b, a + b
+    random.Random(0).shuffle(data)
+    return bytes(data)
+
+
+HUFFMAN_INPUTS = [
+    b"",
+    b"a",
+    b"aaaaaaaa",
+    b"abracadabra",
+    bytes(range(255)) * 3,
+    bytes(random.Random(1).choices(b"etaoin shrdlu", k=5000)),
+    fibonacci_data(20),
+]
+
+
+@pytest.mark.parametrize("data", HUFFMAN_INPUTS)
+@pytest.mark.parametrize("encoder", [week6.huffman_encode, week4.huffman_encode])
+def test_huffman_decode_round_trip(encoder, data):
+    assert week6.huffman_decode(encoder(data)) == data
+
+
+@pytest.mark.parametrize("data", HUFFMAN_INPUTS)
+def test_huffman_decode_opt_round_trip(data):
+    assert week6.huffman_decode_opt(week6.huffman_encode_opt(data)) == data
+
+
+def test_fibonacci_codes_exceed_decode_table():
+    codes = week6.build_tree_codes_linear(collections.Counter(fibonacci_data(20)))
+    assert max(ln for _, ln in codes.values()) > week6.DECODE_TABLE_BITS
+
+
+def run_data(lengths):
+    # alternating runs of the given lengths
+    return b"".join(bytes([i % 2 + 7]) * n for i, n in enumerate(lengths))
+
+
+RLE_INPUTS = [
+    b"",
+    b"x",
+    "héllo wörld",
+    run_data([254, 255, 256, 257, 258]),
+    run_data([1, 2, 3, 4, 5, 2, 1, 3]),
+    run_data([510, 1, 511, 2, 765]),
+    bytes(random.Random(2).choices(b"ab", k=3000)),
+    bytes(random.Random(3).choices(range(256), k=3000)),
+]
+
+
+@pytest.mark.parametrize("data", RLE_INPUTS)
+def test_rle_encode_fast_matches_per_byte_encoders(data):
+    blob = week6.rle_encode_fast(data)
+    assert blob == week6.rle_encode(data) == week6.rle_encode_optimized(data)
+    assert week6.rle_decode_fast(blob) == week6.rle_decode(blob)
+
+
+@pytest.mark.parametrize("data", RLE_INPUTS)
+def test_rle_encode_opt_fast_matches_rle_encode_opt(data):
+    assert week6.rle_encode_opt_fast(data) == week6.rle_encode_opt(data)
+
+
+@pytest.mark.parametrize("min_run", [1, 2, 3, 5])
+@pytest.mark.parametrize("data", RLE_INPUTS)
+def test_rle_encode_min_run_fast_matches_week4(data, min_run):
+    assert week6.rle_encode_min_run_fast(data, min_run) == week4.rle_encode(data, min_run=min_run)
+
+
+@pytest.mark.parametrize("min_run", [2, 3, 5])
+def test_rle_encode_min_run_fast_threshold(min_run):
+    data = run_data([min_run - 1, min_run, min_run - 1, min_run])
+    assert week6.rle_encode_min_run_fast(data, min_run) == week4.rle_encode(data, min_run=min_run)
+    assert week6.rle_decode_opt(week6.rle_encode_min_run_fast(data, min_run)) == data
+
+
+@pytest.mark.parametrize("data", RLE_INPUTS)
+def test_fast_rle_round_trip(data):
+    raw = data.encode("utf-8") if isinstance(data, str) else data
+    assert week6.rle_decode_fast(week6.rle_encode_fast(data)) == raw
+    assert week6.rle_decode_opt(week6.rle_encode_opt_fast(data)) == raw
+    assert week6.rle_decode_opt(week6.rle_encode_min_run_fast(data)) == raw
+
+
+@pytest.mark.parametrize("encoder", week6.WRITABLE_CODECS)
+def test_block_container_round_trip(encoder):
+    data = bytes(range(256)) * 40 + bytes(random.Random(4).choices(b"ab ", k=20000))
+    blob = week6.block_compress(data, encoder, block_size=8192, workers=1)
+    assert week6.block_decompress(blob, workers=1) == data
+    assert week6.read_block(blob, 1) == data[8192:16384]
+
+
+@pytest.mark.parametrize("encoder", [week6.huffman_encode, week6.huffman_encode_opt, week6.huffman_encode_numpy])
+def test_block_compress_rejects_one_byte_count_encoders(encoder):
+    with pytest.raises(ValueError):
+        week6.block_compress(bytes(range(256)), encoder, workers=1)
+
+
+@pytest.mark.parametrize("chunk", [7, 64, week6.NUMPY_ENCODE_CHUNK])
+@pytest.mark.parametrize("data", HUFFMAN_INPUTS)
+def test_huffman_encode_numpy_matches_opt(data, chunk, monkeypatch):
+    # small chunks make the inputs span many slices, carrying partial bytes across
+    monkeypatch.setattr(week6, "NUMPY_ENCODE_CHUNK", chunk)
+    assert week6.huffman_encode_numpy(data) == week6.huffman_encode_opt(data)
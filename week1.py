@@ -1,14 +1,171 @@
+import bisect
+import heapq
+import mmap
 import os
 import random
+import struct
+import sys
+import tracemalloc
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# cycle counts at or above this are split across a process pool when NumPy is unavailable
+PARALLEL_THRESHOLD = 1000000
+BATCH_CHUNK = 1000000
+# numeric fields that get a sorted index for range queries
+RANGE_FIELDS = ("price", "stock", "rating")
+# trie nodes keep the names ending at them under this key; no name character is ""
+TRIE_END = ""
+# fuzzy search stops reading trigram postings (rarest first) once this many entries were visited
+FUZZY_PROBE_BUDGET = 20000
+
+# catalog file layout: header, fixed-width records, string table, open addressing name index
+CATALOG_MAGIC = b"PCAT"
+CATALOG_VERSION = 1
+CATALOG_HEADER = struct.Struct("<4sIIQQQI")   # magic, version, count, records, strings, index offsets, index slots
+CATALOG_RECORD = struct.Struct("<qdqdIHIHIH")  # id, price, stock, rating, (offset, length) of name, category, brand
+CATALOG_SLOT = struct.Struct("<II")            # crc32 of the name, record number + 1 (0 marks an empty slot)
+
+
+class Product:
+    """
+    A compact product record used by the catalog's compact storage mode.
+    __slots__ removes the per-row attribute dict, and the string fields are
+    interned so repeated names, categories and brands share a single object.
+    Supports item["name"] and item.items() so search and print_item treat it
+    like the dict layout.
+    """
+    __slots__ = ("id", "name", "category", "brand", "price", "stock", "rating")
+
+    def __init__(self, id, name, category, brand, price, stock, rating):
+        self.id = id
+        self.name = sys.intern(name)
+        self.category = sys.intern(category)
+        self.brand = sys.intern(brand)
+        self.price = price
+        self.stock = stock
+        self.rating = rating
+
+    def __getitem__(self, field):
+        try:
+            return getattr(self, field)
+        except AttributeError:
+            raise KeyError(field) from None
+
+    def items(self):
+        return [(field, getattr(self, field)) for field in self.__slots__]
+
+    def __repr__(self):
+        return f"Product({', '.join(f'{k}={v!r}' for k, v in self.items())})"
+
+
+class MappedProducts:
+    """
+    Read-only, memory-mapped view over a catalog file written by ProductCatalog.save.
+    Rows are decoded into Product records only when accessed, so opening a
+    catalog costs the same regardless of its size. Behaves like the products
+    list for len(), indexing and iteration, and answers name lookups through
+    the on-disk hash index.
+    """
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            # mapping an empty file raises ValueError itself
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is too short to be a catalog file")
+        except OSError:
+            self._file.close()
+            raise
+        if len(self._map) < CATALOG_HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is too short to be a catalog file")
+        magic, version, count, records, strings, index, slots = CATALOG_HEADER.unpack_from(self._map, 0)
+        if magic != CATALOG_MAGIC or version != CATALOG_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {CATALOG_VERSION} catalog file")
+        self._count = count
+        self._records = records
+        self._strings = strings
+        self._index = index
+        self._slots = slots
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("catalog record out of range")
+        (pid, price, stock, rating,
+         name_off, name_len, cat_off, cat_len, brand_off, brand_len) = CATALOG_RECORD.unpack_from(
+            self._map, self._records + i * CATALOG_RECORD.size)
+        return Product(pid, self._string(name_off, name_len), self._string(cat_off, cat_len),
+                       self._string(brand_off, brand_len), price, stock, rating)
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def _string(self, offset, length):
+        start = self._strings + offset
+        return self._map[start:start + length].decode("utf-8")
+
+    def _name_at(self, i):
+        # the name's (offset, length) pair follows the four 8-byte numeric fields
+        name_off, name_len = struct.unpack_from("<IH", self._map, self._records + i * CATALOG_RECORD.size + 32)
+        start = self._strings + name_off
+        return self._map[start:start + name_len]
+
+    def names(self):
+        """
+        Yields every product name without decoding the rest of the row.
+        """
+        for i in range(self._count):
+            yield self._name_at(i).decode("utf-8")
+
+    def search(self, query:str):
+        """
+        Looks a name up in the on-disk index. Iterations counts the slots probed.
+        """
+        if not self._slots:
+            return (False, 0, {})
+        key = query.encode("utf-8")
+        digest = zlib.crc32(key)
+        slot = digest & (self._slots - 1)
+        probes = 0
+        while True:
+            probes += 1
+            stored, record = CATALOG_SLOT.unpack_from(self._map, self._index + slot * CATALOG_SLOT.size)
+            if record == 0:
+                return (False, probes, {})
+            if stored == digest and self._name_at(record - 1) == key:
+                return (True, probes, self[record - 1])
+            slot = (slot + 1) & (self._slots - 1)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
 class ProductCatalog:
     """
     A class to represent a product catalog with search functionality and random product generation.
     Attributes:
         product (str): The name of the product to be queried.
-        products (list): A list of dictionaries representing the product database.
+        products (list): A list of dictionaries (or Product records in compact mode) representing the product database.
     Methods:
-        __init__():
+        __init__(indexed=False, compact=False, size=100):
             Initializes the ProductCatalog instance with a default product name and a randomly generated product database.
+            compact stores each row as a __slots__ Product record instead of a dict.
         search(query: str) -> tuple:
             Searches for a product in the catalog by its name.
             Args:
@@ -18,7 +175,7 @@ class ProductCatalog:
                        the number of iterations performed during the search, 
                        and the product details as a dictionary (empty if not found).
         generate_random_db() -> list:
-            Generates a random product database with 100 entries, inserting the query product at a random position.
+            Generates a random product database with size entries, inserting the query product at a random position.
             Returns:
                 list: A list of dictionaries representing the product database.
         generate_random_product(i: int) -> dict:
@@ -27,13 +184,109 @@ class ProductCatalog:
                 i (int): The unique identifier for the product.
             Returns:
                 dict: A dictionary containing the details of the randomly generated product.
+        build_index():
+            Builds a hash index on name and secondary indexes on category and brand.
+            Once built, search uses the name index instead of a linear scan.
+        add_product(item: dict) / remove_product(name: str):
+            Adds or removes a product, keeping any built indexes in sync.
+        search_many(queries: list) -> list:
+            Resolves a batch of name queries in a single pass over the catalog.
+            Returns:
+                list: One (found, iterations, item) tuple per query, in query order.
+        search_category(category: str) / search_brand(brand: str) -> tuple:
+            Looks up all products in a category or brand through the secondary indexes.
+            Returns:
+                tuple: (found, probes, list of matching products).
+        prefix_search(prefix: str, k: int = 10) / fuzzy_search(query: str, k: int = 10) -> tuple:
+            Autocomplete through a name trie, or typo tolerant lookup through a trigram index.
+            Returns:
+                tuple: (found, probes, list of (similarity, product) pairs, best first).
+        range_query(**ranges) -> tuple:
+            Finds products whose numeric fields fall inside inclusive (low, high) ranges,
+            e.g. range_query(price=(10, 60), rating=(4.5, None)). Uses sorted indexes when indexed.
+            Returns:
+                tuple: (found, probes, list of matching products).
+        save(path: str) / ProductCatalog.open(path: str):
+            Writes the catalog to a compact binary file, or opens one through mmap.
+            An opened catalog reads rows lazily and searches through the on-disk name index.
+            It is read-only: add_product and remove_product raise ValueError.
     """
-    def __init__(self):
+    def __init__(self, indexed=False, compact=False, size=100, products=None):
        self.product = "harness"
-       self.products = self.generate_random_db()
+       self.compact = compact
+       self.size = size
+       self.products = self.generate_random_db() if products is None else products
+       self.indexed = False
+       self.name_index = {}
+       self.category_index = {}
+       self.brand_index = {}
+       self.range_index = {}
+       self.name_trie = {}
+       self.trigram_index = {}
+       self.name_searchable = False
+       if indexed:
+           self.build_index()
        ##create a function to print the random
     
+    @classmethod
+    def open(cls, path:str, indexed=False):
+        """
+        Opens a catalog file written by save. Rows stay on disk and are decoded on access.
+        """
+        return cls(indexed=indexed, compact=True, products=MappedProducts(path))
+
+    def save(self, path:str):
+        """
+        Serializes the catalog: fixed-width records, a deduplicated string table
+        and an open addressing hash index on name, sized to at most half full.
+        """
+        strings = bytearray()
+        offsets = {}
+
+        def intern(text):
+            raw = text.encode("utf-8")
+            if raw not in offsets:
+                offsets[raw] = len(strings)
+                strings.extend(raw)
+            return offsets[raw], len(raw)
+
+        records = bytearray()
+        for item in self.products:
+            records.extend(CATALOG_RECORD.pack(item["id"], item["price"], item["stock"], item["rating"],
+                                               *intern(item["name"]), *intern(item["category"]),
+                                               *intern(item["brand"])))
+        slots = 1
+        while slots < 2 * len(self.products):
+            slots <<= 1
+        index = bytearray(slots * CATALOG_SLOT.size)
+        seen = set()
+        for i, item in enumerate(self.products):
+            key = item["name"].encode("utf-8")
+            # only the first product with a name is reachable, same as search
+            if key in seen:
+                continue
+            seen.add(key)
+            digest = zlib.crc32(key)
+            slot = digest & (slots - 1)
+            while CATALOG_SLOT.unpack_from(index, slot * CATALOG_SLOT.size)[1]:
+                slot = (slot + 1) & (slots - 1)
+            CATALOG_SLOT.pack_into(index, slot * CATALOG_SLOT.size, digest, i + 1)
+
+        records_off = CATALOG_HEADER.size
+        strings_off = records_off + len(records)
+        index_off = strings_off + len(strings)
+        with open(path, "wb") as f:
+            f.write(CATALOG_HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, len(self.products),
+                                        records_off, strings_off, index_off, slots))
+            f.write(records)
+            f.write(strings)
+            f.write(index)
+
     def search(self,query:str):
+        if self.indexed:
+            return self.indexed_search(query)
+        if isinstance(self.products, MappedProducts):
+            return self.products.search(query)
         iterations = 0 
         for item in self.products:
             iterations +=1
@@ -42,12 +295,312 @@ class ProductCatalog:
         else:
             return (False,iterations,{})
 
+    def search_many(self, queries):
+        """
+        Resolves a batch of name queries with one pass over self.products.
+        Each result reports the same iteration count a separate search call
+        would have, and the scan stops as soon as every query is resolved.
+        """
+        if self.indexed:
+            return [self.indexed_search(query) for query in queries]
+        if isinstance(self.products, MappedProducts):
+            return [self.products.search(query) for query in queries]
+        results = [None] * len(queries)
+        pending = {}
+        for pos, query in enumerate(queries):
+            pending.setdefault(query, []).append(pos)
+        iterations = 0
+        for item in self.products:
+            if not pending:
+                break
+            iterations += 1
+            positions = pending.pop(item["name"], None)
+            if positions:
+                for pos in positions:
+                    results[pos] = (True, iterations, item)
+        for positions in pending.values():
+            for pos in positions:
+                results[pos] = (False, len(self.products), {})
+        return results
+
+    def indexed_search(self, query:str):
+        """
+        Looks up a product through the name index.
+        A hash lookup is a single probe, so iterations is always 1 and can be
+        compared directly against the linear search count.
+        """
+        matches = self.name_index.get(query)
+        if matches:
+            return (True, 1, matches[0])
+        return (False, 1, {})
+
+    def search_category(self, category:str):
+        return self._secondary_search(self.category_index, "category", category)
+
+    def search_brand(self, brand:str):
+        return self._secondary_search(self.brand_index, "brand", brand)
+
+    def _secondary_search(self, index, field, value):
+        # without an index fall back to a full scan, counting each product visited
+        if not self.indexed:
+            matches = [item for item in self.products if item[field] == value]
+            return (bool(matches), len(self.products), matches)
+        matches = index.get(value, [])
+        return (bool(matches), 1, list(matches))
+
+    def range_query(self, **ranges):
+        """
+        Finds products matching every inclusive (low, high) range; None leaves a bound open.
+        With an index the field whose range selects the fewest rows drives the scan
+        and the remaining ranges are checked on those rows only. Probes counts the
+        binary search steps plus the rows checked, like iterations in search.
+        """
+        for field in ranges:
+            if field not in RANGE_FIELDS:
+                raise ValueError(f"range queries support {', '.join(RANGE_FIELDS)}, not {field!r}")
+
+        def matches(item):
+            for field, (low, high) in ranges.items():
+                if low is not None and item[field] < low:
+                    return False
+                if high is not None and item[field] > high:
+                    return False
+            return True
+
+        if not self.indexed or not ranges:
+            hits = [item for item in self.products if matches(item)]
+            return (bool(hits), len(self.products), hits)
+
+        probes = 0
+        driver = None
+        for field, (low, high) in ranges.items():
+            values, items = self.range_index[field]
+            start, p1 = (0, 0) if low is None else _bisect_probes(values, low, right=False)
+            stop, p2 = (len(values), 0) if high is None else _bisect_probes(values, high, right=True)
+            probes += p1 + p2
+            if driver is None or stop - start < driver[2] - driver[1]:
+                driver = (items, start, stop)
+        items, start, stop = driver
+        hits = []
+        for item in items[start:stop]:
+            probes += 1
+            if matches(item):
+                hits.append(item)
+        return (bool(hits), probes, hits)
+
+    def prefix_search(self, prefix:str, k:int=10):
+        """
+        Autocompletes a partial name, case insensitively, through the name trie.
+        Completions are visited breadth first so the shortest names, which are the
+        closest to the prefix, come back first. Builds the name trie on first use.
+        """
+        if not self.name_searchable:
+            self._build_name_search_index()
+        node = self.name_trie
+        probes = 0
+        for ch in prefix.lower():
+            probes += 1
+            node = node.get(ch)
+            if node is None:
+                return (False, probes, [])
+        results = []
+        queue = [node]
+        for node in queue:
+            probes += 1
+            for name in sorted(node.get(TRIE_END, ())):
+                results.append((len(prefix) / len(name) if name else 1.0, self._product_named(name)))
+                if len(results) == k:
+                    return (True, probes, results)
+            queue.extend(child for ch, child in node.items() if ch != TRIE_END)
+        return (bool(results), probes, results)
+
+    def fuzzy_search(self, query:str, k:int=10):
+        """
+        Finds the k names most similar to query, tolerating typos.
+        Similarity is the Jaccard overlap of the padded trigram sets. Candidates
+        come from the rarest trigrams of the query first, and common trigrams are
+        skipped once the probe budget is spent. Builds the trigram index on first use.
+        """
+        if not self.name_searchable:
+            self._build_name_search_index()
+        grams = _trigrams(query)
+        postings = sorted((self.trigram_index.get(g, ()) for g in grams), key=len)
+        probes = 0
+        shared = Counter()
+        for posting in postings:
+            if shared and probes + len(posting) > FUZZY_PROBE_BUDGET:
+                break
+            probes += len(posting)
+            shared.update(posting)
+        # rank exactly only the candidates sharing the most trigrams, closest length first on ties
+        shortlist = heapq.nlargest(k * 4, shared.items(),
+                                   key=lambda kv: (kv[1], -abs(len(kv[0]) - len(query))))
+        candidates = {name for name, _ in shortlist}
+        node = self.name_trie
+        for ch in query.lower():
+            node = node.get(ch, {})
+        candidates.update(node.get(TRIE_END, ()))
+        scored = []
+        for name in candidates:
+            name_grams = _trigrams(name)
+            scored.append((len(grams & name_grams) / len(grams | name_grams), name))
+        best = heapq.nlargest(k, scored)
+        results = [(score, self._product_named(name)) for score, name in best]
+        return (bool(results), probes, results)
+
+    def in_stock(self):
+        return self.range_query(stock=(1, None))
+
+    def build_index(self):
+        self.name_index = {}
+        self.category_index = {}
+        self.brand_index = {}
+        self.name_trie = {}
+        self.trigram_index = {}
+        for item in self.products:
+            self._index_item(item)
+        self.range_index = {}
+        for field in RANGE_FIELDS:
+            ordered = sorted(self.products, key=lambda item: item[field])
+            self.range_index[field] = ([item[field] for item in ordered], ordered)
+        self.indexed = True
+        self.name_searchable = True
+
+    def _build_name_search_index(self):
+        """
+        Builds only the name trie and trigram index behind prefix_search and
+        fuzzy_search. Unlike build_index this leaves self.indexed alone, so search
+        keeps its linear scan, and an opened catalog only reads the names instead
+        of decoding every row.
+        """
+        self.name_trie = {}
+        self.trigram_index = {}
+        if isinstance(self.products, MappedProducts):
+            for name in set(self.products.names()):
+                self._add_name(name)
+        else:
+            self.name_index = {}
+            for item in self.products:
+                self._index_name(item)
+        self.name_searchable = True
+
+    def _product_named(self, name):
+        matches = self.name_index.get(name)
+        if matches:
+            return matches[0]
+        # opened catalogs without build_index resolve names through the on-disk index
+        return self.products.search(name)[2]
+
+    def _check_writable(self):
+        if isinstance(self.products, MappedProducts):
+            raise ValueError("a catalog opened from a file is read-only")
+
+    def add_product(self, item:dict):
+        self._check_writable()
+        self.products.append(item)
+        if self.indexed:
+            self._index_item(item)
+            for field in RANGE_FIELDS:
+                values, items = self.range_index[field]
+                pos = bisect.bisect_right(values, item[field])
+                values.insert(pos, item[field])
+                items.insert(pos, item)
+        elif self.name_searchable:
+            self._index_name(item)
+
+    def remove_product(self, name:str):
+        """
+        Removes the first product with the given name.
+        Returns the removed product, or None if no product has that name.
+        """
+        self._check_writable()
+        found, _, item = self.search(name)
+        if not found:
+            return None
+        for pos, candidate in enumerate(self.products):
+            if candidate is item:
+                del self.products[pos]
+                break
+        if self.indexed:
+            self._unindex_item(item)
+        elif self.name_searchable:
+            self._unindex_name_item(item)
+        return item
+
+    def _index_item(self, item):
+        self._index_name(item)
+        self.category_index.setdefault(item["category"], []).append(item)
+        self.brand_index.setdefault(item["brand"], []).append(item)
+
+    def _index_name(self, item):
+        name = item["name"]
+        if name not in self.name_index:
+            self._add_name(name)
+        self.name_index.setdefault(name, []).append(item)
+
+    def _add_name(self, name):
+        node = self.name_trie
+        for ch in name.lower():
+            node = node.setdefault(ch, {})
+        node.setdefault(TRIE_END, set()).add(name)
+        for gram in _trigrams(name):
+            self.trigram_index.setdefault(gram, set()).add(name)
+
+    def _unindex_item(self, item):
+        for index, field in ((self.category_index, "category"),
+                             (self.brand_index, "brand")):
+            bucket = index[item[field]]
+            for pos, candidate in enumerate(bucket):
+                if candidate is item:
+                    del bucket[pos]
+                    break
+            if not bucket:
+                del index[item[field]]
+        self._unindex_name_item(item)
+        for field in RANGE_FIELDS:
+            values, items = self.range_index[field]
+            pos = bisect.bisect_left(values, item[field])
+            while items[pos] is not item:
+                pos += 1
+            del values[pos]
+            del items[pos]
+
+    def _unindex_name_item(self, item):
+        bucket = self.name_index[item["name"]]
+        for pos, candidate in enumerate(bucket):
+            if candidate is item:
+                del bucket[pos]
+                break
+        if not bucket:
+            del self.name_index[item["name"]]
+            self._unindex_name(item["name"])
+
+    def _unindex_name(self, name):
+        path = [self.name_trie]
+        for ch in name.lower():
+            path.append(path[-1][ch])
+        path[-1][TRIE_END].discard(name)
+        if not path[-1][TRIE_END]:
+            del path[-1][TRIE_END]
+        # prune nodes left without names or children, deepest first
+        for depth in range(len(path) - 1, 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][name.lower()[depth - 1]]
+        for gram in _trigrams(name):
+            posting = self.trigram_index[gram]
+            posting.discard(name)
+            if not posting:
+                del self.trigram_index[gram]
+
         
     def generate_random_db(self):
         query_product = {"id": 201, "name": f"{self.product}", "category": "harnesses", "brand": "Black Diamond", "price": 59.99, "stock": 20, "rating": 4.9}
-        random_entry_point = random.randint(0,100)
+        if self.compact:
+            query_product = Product(**query_product)
+        random_entry_point = random.randint(0,self.size)
         product_list = []
-        for i in range(0,100):
+        for i in range(0,self.size):
             if i == random_entry_point:
                 product_list.append(query_product)
             else:
@@ -57,6 +610,8 @@ class ProductCatalog:
     
     
     def generate_random_product(self,i):
+        if self.compact:
+            return Product(i, f"Product{i}", "random", "random", 10.99, 10, 4.5)
         return {
                     "id": i,
                     "name": f"Product{i}",
@@ -67,7 +622,65 @@ class ProductCatalog:
                     "rating": 4.5
                 }
 
-    
+
+def memory_report(size:int=100000):
+    """
+    Compares the memory used by the dict layout and the compact Product layout.
+
+    Args:
+        size (int): Number of products to generate for each layout.
+
+    Returns:
+        dict: Bytes allocated per layout and per row, keyed by "dict" and "compact".
+    """
+    if size < 1:
+        raise ValueError("memory report needs at least 1 product")
+    report = {}
+    for label, compact in (("dict", False), ("compact", True)):
+        tracemalloc.start()
+        catalog = ProductCatalog(compact=compact, size=size)
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report[label] = {"bytes": used, "per_row": used / len(catalog.products)}
+        del catalog
+    return report
+
+def print_memory_report(report):
+    for label, stats in report.items():
+        print(f"{label:8s} {stats['bytes']:12d} bytes  {stats['per_row']:8.1f} bytes/row")
+    print(f"compact layout uses {report['compact']['bytes'] / report['dict']['bytes']:.0%} of the dict layout")
+
+def _trigrams(name):
+    padded = f"  {name.lower()} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def _bisect_probes(values, target, right):
+    """
+    bisect_left/bisect_right over a sorted list that also returns how many
+    elements were compared, so range queries can report their probe count.
+    """
+    lo, hi, probes = 0, len(values), 0
+    while lo < hi:
+        mid = (lo + hi) // 2
+        probes += 1
+        if values[mid] < target or (right and values[mid] == target):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo, probes
+
+def print_matches(result):
+    """
+    Prints prefix or fuzzy search results as ranked (similarity, name) lines.
+    """
+    found, probes, matches = result
+    if not found:
+        print(f"No similar products. in {probes} probes")
+        return
+    print(f"Found {len(matches)} matches in {probes} probes")
+    for score, item in matches:
+        print(f"{score:5.2f}  {item['name']}")
+
 def about():
     """
     Prints Program Flow
@@ -76,11 +689,17 @@ def about():
     print("this program generates a synthetic product catalog ")
     print("option 1 : create a catalog wiht sytnthetic data")
     print("option 2 : user can search for a product in the catalog. The only product that has a fixed name is harness")
-    print("option 3 : batch test the search function.")
+    print("option 3 : search by partial name (autocomplete) or with typos (fuzzy). Builds the index if needed")
+    print("option 4 : batch test the search function.")
     print("this will create a dummy catalog and search for harness for the amount of cycles specified")
     print("It returns the Min, Max, and average steps it took to find the product")
-    print("option 4 : About")
-    print("option 4 : exit the program")
+    print("catalogs can optionally be indexed, which turns each search into a single hash probe")
+    print("option 5 : bulk benchmark. Simulates only where harness lands, so millions of cycles run in seconds,")
+    print("and reports percentiles and the full step distribution")
+    print("option 6 : compare memory of the dict layout against compact Product records")
+    print("option 7 : save the catalog to a file, or load a saved catalog instantly through mmap")
+    print("option 8 : About")
+    print("option 9 : exit the program")
 
 def print_item(item):
     """
@@ -113,13 +732,17 @@ def main_menu():
         print("Main Menu:")
         print("1. Create Catalog")
         print("2. Search Product")
-        print("3. Batch Test")
-        print("4. About")
-        print("5. Exit")
+        print("3. Prefix/Fuzzy Search")
+        print("4. Batch Test")
+        print("5. Bulk Benchmark")
+        print("6. Memory Report")
+        print("7. Save/Load Catalog")
+        print("8. About")
+        print("9. Exit")
         
         try:
             choice = int(input("Select an option: ").strip())
-            if choice in {1, 2, 3, 4,  5}:
+            if choice in {1, 2, 3, 4, 5, 6, 7, 8, 9}:
                 return choice
             else:
                 print("Invalid selection. Please choose a valid option.")
@@ -127,12 +750,13 @@ def main_menu():
             print("Invalid input. Please enter a number.")
             input("Press enter to continue")
 
-def auto_test(cycles:int):
+def auto_test(cycles:int, indexed=False):
         """
         Simulates a series of automated tests on a product catalog and returns statistical results.
 
         Args:
             cycles (int): The number of test cycles to perform.
+            indexed (bool): Build the name index on each catalog before searching.
 
         Returns:
             tuple: A tuple containing the minimum, maximum, and average values of the second element 
@@ -140,7 +764,7 @@ def auto_test(cycles:int):
         """
         steps = []
         for i in range(0,cycles):
-            catalog = ProductCatalog()
+            catalog = ProductCatalog(indexed=indexed)
             query = catalog.product
             item = catalog.search(query)
             #print(item[1])
@@ -148,6 +772,98 @@ def auto_test(cycles:int):
             #print(steps)
         return (min(steps),max(steps), sum(steps)/len(steps))
 
+def _placement_histogram(cycles:int, size:int, seed):
+    """
+    Counts linear search steps for `cycles` random placements of the query product.
+    Mirrors generate_random_db: the product lands at randint(0, size), and a
+    position of `size` means it was never inserted so the scan visits all rows.
+    Returns a list where index s holds the number of searches that took s steps.
+    """
+    counts = [0] * (size + 1)
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        remaining = cycles
+        while remaining:
+            chunk = min(remaining, BATCH_CHUNK)
+            positions = rng.integers(0, size + 1, chunk)
+            steps = np.minimum(positions + 1, size)
+            for s, c in enumerate(np.bincount(steps, minlength=size + 1).tolist()):
+                counts[s] += c
+            remaining -= chunk
+        return counts
+    rng = random.Random(seed)
+    placements = range(size + 1)
+    remaining = cycles
+    while remaining:
+        chunk = min(remaining, BATCH_CHUNK)
+        for pos, c in Counter(rng.choices(placements, k=chunk)).items():
+            counts[min(pos + 1, size)] += c
+        remaining -= chunk
+    return counts
+
+def batch_test(cycles:int, size:int=100, workers=None, seed=None):
+    """
+    Bulk version of auto_test that only simulates where the query product is placed.
+    auto_test spends almost all of its time building catalogs; the number of
+    steps a linear search takes depends only on the placement, so this draws
+    placements in bulk (NumPy when available, otherwise a process pool for
+    large cycle counts) and reports the full step distribution.
+
+    Args:
+        cycles (int): The number of simulated searches.
+        size (int): Catalog size, matching ProductCatalog(size=...).
+        workers (int): Process pool size for the pure Python path. Defaults to os.cpu_count().
+        seed (int): Seed for reproducible runs.
+
+    Returns:
+        dict: min, max, mean, p50/p90/p99 percentiles and the step distribution {steps: count}.
+    """
+    if cycles <= 0:
+        raise ValueError("cycles must be positive")
+    if np is not None or cycles < PARALLEL_THRESHOLD:
+        counts = _placement_histogram(cycles, size, seed)
+    else:
+        workers = workers or os.cpu_count() or 1
+        seeder = random.Random(seed)
+        shares = [cycles // workers + (1 if k < cycles % workers else 0) for k in range(workers)]
+        seeds = [seeder.getrandbits(64) for _ in shares]
+        counts = [0] * (size + 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(_placement_histogram, shares, [size] * workers, seeds):
+                for s, c in enumerate(part):
+                    counts[s] += c
+
+    distribution = {s: c for s, c in enumerate(counts) if c}
+    steps = sorted(distribution)
+    total = sum(s * c for s, c in distribution.items())
+
+    def percentile(p):
+        target = p / 100 * cycles
+        seen = 0
+        for s in steps:
+            seen += distribution[s]
+            if seen >= target:
+                return s
+        return steps[-1]
+
+    return {
+        "cycles": cycles,
+        "min": steps[0],
+        "max": steps[-1],
+        "mean": total / cycles,
+        "p50": percentile(50),
+        "p90": percentile(90),
+        "p99": percentile(99),
+        "distribution": distribution,
+    }
+
+def print_batch_results(results):
+    print(f"Out of {results['cycles']} cycles, found item in Min: {results['min']} Max: {results['max']}, Avg: {results['mean']:.2f}")
+    print(f"Percentiles p50: {results['p50']} p90: {results['p90']} p99: {results['p99']}")
+    print("****Step distribution*******")
+    for steps, count in sorted(results["distribution"].items()):
+        print(f"{steps:6d} : {count}")
+
 def control_loop():
     catalog = None 
     while True:
@@ -155,7 +871,9 @@ def control_loop():
 
         if menu_selection == 1:
             try:
-                catalog = ProductCatalog()
+                indexed = input("Build search index? (y/n): ").strip().lower() == "y"
+                compact = input("Use compact storage? (y/n): ").strip().lower() == "y"
+                catalog = ProductCatalog(indexed=indexed, compact=compact)
             except Exception as e:
                 print(f"Failed to create catalog: {e}")
             input("Press enter to continue")
@@ -171,11 +889,27 @@ def control_loop():
                 except Exception as e:
                     print(f"Error searching for product: {e}")
             input("Press enter to continue")
-         
+
         elif menu_selection == 3:
+            if catalog is None:
+                print("Catalog not created. Please create a catalog first.")
+            else:
+                try:
+                    query = input("Enter partial or misspelled product name: ")
+                    mode = input("Search type (p = prefix, f = fuzzy): ").strip().lower()
+                    if mode == "p":
+                        print_matches(catalog.prefix_search(query))
+                    else:
+                        print_matches(catalog.fuzzy_search(query))
+                except Exception as e:
+                    print(f"Error searching for product: {e}")
+            input("Press enter to continue")
+         
+        elif menu_selection == 4:
             try:
                cycles = int(input("Enter number of cycles to test:"))
-               results = auto_test(cycles)
+               indexed = input("Use indexed search? (y/n): ").strip().lower() == "y"
+               results = auto_test(cycles, indexed)
                print(f"Out of {cycles} cycles, found item in Min: {results[0]} Max: {results[1]}, Avg: {results[2]}")
                input("Press enter to continue")
             except ValueError:
@@ -183,11 +917,44 @@ def control_loop():
                 input("Press enter to continue")
              
 
-        elif menu_selection == 4:
+        elif menu_selection == 5:
+            try:
+                cycles = int(input("Enter number of cycles to test:"))
+                print_batch_results(batch_test(cycles))
+            except ValueError:
+                print("Invalid input. Please enter a number.")
+            input("Press enter to continue")
+
+        elif menu_selection == 6:
+            try:
+                size = int(input("Enter number of products to compare: "))
+                print_memory_report(memory_report(size))
+            except ValueError:
+                print("Invalid input. Please enter a number.")
+            input("Press enter to continue")
+
+        elif menu_selection == 7:
+            try:
+                mode = input("Save or load (s/l): ").strip().lower()
+                path = input("Enter catalog file path: ").strip()
+                if mode == "s":
+                    if catalog is None:
+                        print("Catalog not created. Please create a catalog first.")
+                    else:
+                        catalog.save(path)
+                        print(f"Saved {len(catalog.products)} products to {path}")
+                else:
+                    catalog = ProductCatalog.open(path)
+                    print(f"Loaded {len(catalog.products)} products from {path}")
+            except (OSError, ValueError) as e:
+                print(f"Catalog file error: {e}")
+            input("Press enter to continue")
+
+        elif menu_selection == 8:
             about()
             input("Press enter to continue")
 
-        elif menu_selection == 5:
+        elif menu_selection == 9:
             print("Goodbye")
             break  
 
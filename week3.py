@@ -1,17 +1,167 @@
+import argparse
+import bisect
+import csv
+import heapq
+import itertools
+import math
+import pickle
 import random
 import os
-from datetime import datetime, timedelta
+import tempfile
+import time
+import tracemalloc
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# runs shorter than this are extended with insertion sort before merging
+INSERTION_CUTOFF = 32
+# ISO date fields; cached sorts compare these as integer day ordinals instead of strings
+DATE_KEYS = {"dob", "admission_date"}
+# records per in-memory chunk for external sorts
+EXTERNAL_CHUNK_SIZE = 100000
+# records per batch for the streaming patient generator
+PATIENT_BATCH_SIZE = 100000
+PATIENT_FIELDS = ["patient_id", "first_name", "last_name", "dob", "admission_date"]
+FIRST_NAMES = ["Ava", "Liam", "Sophia", "Elijah", "Isabella", "Mateo", "Emily", "Noah", "Mia", "Ethan", "Zoe", "Lucas"]
+LAST_NAMES = ["Thompson", "Rodriguez", "Patel", "Kim", "Nguyen", "Carter", "Johnson", "Singh", "Lewis", "Martinez", "Brooks", "Clark"]
+# benchmark_sorts input shapes, and the size past which bubble sort is skipped
+SORT_DISTRIBUTIONS = ("random", "presorted", "reversed", "duplicates")
+BUBBLE_SORT_LIMIT = 2000
+# target bucket size for SortedView; buckets split at twice this
+SORTED_VIEW_LOAD = 500
+
+class SortedView:
+    """
+    Records kept in order of one field, updated in place as admissions arrive.
+    Records live in sorted buckets of at most 2 * load entries, with each bucket's
+    largest key kept in a separate list. Insert and remove bisect the bucket maxima
+    and then one bucket, so each costs O(log n) comparisons plus a shift bounded
+    by the bucket size, and iteration never needs a resort. Records with equal
+    keys stay in insertion order.
+    """
+    def __init__(self, records=(), key="admission_date", load=SORTED_VIEW_LOAD):
+        self.key = key
+        self._load = load
+        ordered = sorted(records, key=lambda record: record[key])
+        self._records = [ordered[i:i + load] for i in range(0, len(ordered), load)]
+        self._keys = [[record[key] for record in bucket] for bucket in self._records]
+        self._maxes = [keys[-1] for keys in self._keys]
+        self._len = len(ordered)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for bucket in self._records:
+            yield from bucket
+
+    def insert(self, record):
+        value = record[self.key]
+        if not self._maxes:
+            self._records.append([record])
+            self._keys.append([value])
+            self._maxes.append(value)
+            self._len = 1
+            return
+        b = bisect.bisect_right(self._maxes, value)
+        if b == len(self._maxes):
+            b -= 1
+        keys = self._keys[b]
+        pos = bisect.bisect_right(keys, value)
+        keys.insert(pos, value)
+        self._records[b].insert(pos, record)
+        self._maxes[b] = keys[-1]
+        self._len += 1
+        if len(keys) > 2 * self._load:
+            half = len(keys) // 2
+            self._keys[b + 1:b + 1] = [keys[half:]]
+            self._records[b + 1:b + 1] = [self._records[b][half:]]
+            del keys[half:]
+            del self._records[b][half:]
+            self._maxes[b:b + 1] = [keys[-1], self._keys[b + 1][-1]]
+
+    def remove(self, record):
+        """
+        Removes this exact record object. Raises ValueError if it is not in the view.
+        """
+        value = record[self.key]
+        b = bisect.bisect_left(self._maxes, value)
+        # equal keys can spill over several buckets
+        while b < len(self._maxes):
+            keys = self._keys[b]
+            pos = bisect.bisect_left(keys, value)
+            while pos < len(keys) and keys[pos] == value:
+                if self._records[b][pos] is record:
+                    del keys[pos]
+                    del self._records[b][pos]
+                    self._len -= 1
+                    if keys:
+                        self._maxes[b] = keys[-1]
+                    else:
+                        del self._keys[b], self._records[b], self._maxes[b]
+                    return
+                pos += 1
+            if pos < len(keys):
+                break
+            b += 1
+        raise ValueError("record is not in the sorted view")
+
+    def irange(self, low=None, high=None):
+        """
+        Yields the records whose key lies in the inclusive range [low, high], in order.
+        """
+        b = 0 if low is None else bisect.bisect_left(self._maxes, low)
+        for b in range(b, len(self._keys)):
+            keys = self._keys[b]
+            pos = 0 if low is None else bisect.bisect_left(keys, low)
+            for pos in range(pos, len(keys)):
+                if high is not None and keys[pos] > high:
+                    return
+                yield self._records[b][pos]
+
 
 class PatientRecord:
     def __init__(self, records):
         self.records = records
         self.steps = 0
+        self.views = []
+
+    def sorted_view(self, key="admission_date"):
+        """
+        Returns a SortedView of the records that admit and discharge keep up to date.
+        """
+        view = SortedView(self.records, key)
+        self.views.append(view)
+        return view
+
+    def admit(self, record):
+        self.records.append(record)
+        for view in self.views:
+            view.insert(record)
 
-    def bubble_sort(self, key):
+    def discharge(self, record):
+        for pos, candidate in enumerate(self.records):
+            if candidate is record:
+                del self.records[pos]
+                break
+        else:
+            raise ValueError("record is not in the patient list")
+        for view in self.views:
+            view.remove(record)
+
+    def bubble_sort(self, key, records=None):
         self.steps = 0
-        n = len(self.records)
+        if records is None:
+            records = self.records
+        n = len(records)
         #use copy to keep original list unsorted to allow for comparisons of multiple sort methods with same data
-        sorted_records = self.records.copy() 
+        sorted_records = records.copy() 
         for i in range(n):
             for j in range(0, n - i - 1):
                 self.steps += 1
@@ -19,14 +169,16 @@ class PatientRecord:
                     sorted_records[j], sorted_records[j + 1] = sorted_records[j + 1], sorted_records[j]
         return sorted_records
 
-    def merge_sort(self, key):
+    def merge_sort(self, key, records=None):
         """
-        Perform a merge sort on self.records based on the given key.
+        Perform a merge sort on self.records (or the given records) based on the given key.
         Returns a sorted copy of the records.
         """
         self.steps = 0
+        if records is None:
+            records = self.records
          #use copy to keep original list unsorted to allow for comparisons of multiple sort methods with same data
-        return self._merge_sort(self.records.copy(), key)
+        return self._merge_sort(records.copy(), key)
 
     def _merge_sort(self, records, key):
         """
@@ -62,23 +214,338 @@ class PatientRecord:
         merged.extend(right[j:])
         return merged
 
-    def sort_with_metrics(self, method="bubble", key="admission_date"):
+    def adaptive_sort(self, key, records=None):
+        """
+        Timsort-style stable sort on self.records (or the given records) based on the given key.
+        Detects natural ascending and strictly descending runs, extends short
+        runs to INSERTION_CUTOFF with insertion sort, then merges runs bottom-up
+        through a single preallocated buffer. Returns a sorted copy of the records.
+        """
+        self.steps = 0
+        records = (self.records if records is None else records).copy()
+        n = len(records)
+        runs = []
+        start = 0
+        while start < n:
+            end = self._find_run(records, start, key)
+            if end - start < INSERTION_CUTOFF:
+                stop = min(start + INSERTION_CUTOFF, n)
+                self._insertion_sort(records, start, end, stop, key)
+                end = stop
+            runs.append((start, end))
+            start = end
+
+        src, dst = records, [None] * n
+        while len(runs) > 1:
+            merged = []
+            for r in range(0, len(runs) - 1, 2):
+                lo, mid = runs[r]
+                hi = runs[r + 1][1]
+                self._merge_into(src, dst, lo, mid, hi, key)
+                merged.append((lo, hi))
+            if len(runs) % 2:
+                lo, hi = runs[-1]
+                for k in range(lo, hi):
+                    dst[k] = src[k]
+                merged.append((lo, hi))
+            runs = merged
+            src, dst = dst, src
+        return src
+
+    def _find_run(self, records, start, key):
+        """
+        Returns the end of the natural run beginning at start.
+        Strictly descending runs are reversed in place, which keeps the sort stable.
+        """
+        n = len(records)
+        end = start + 1
+        if end == n:
+            return end
+        self.steps += 1
+        if records[end][key] < records[start][key]:
+            end += 1
+            while end < n:
+                self.steps += 1
+                if not records[end][key] < records[end - 1][key]:
+                    break
+                end += 1
+            i, j = start, end - 1
+            while i < j:
+                records[i], records[j] = records[j], records[i]
+                i += 1
+                j -= 1
+        else:
+            end += 1
+            while end < n:
+                self.steps += 1
+                if records[end][key] < records[end - 1][key]:
+                    break
+                end += 1
+        return end
+
+    def _insertion_sort(self, records, start, sorted_end, stop, key):
+        """
+        Binary insertion sorts records[start:stop], given records[start:sorted_end] is already sorted.
+        Inserting after equal keys keeps the sort stable.
+        """
+        for p in range(sorted_end, stop):
+            item = records[p]
+            lo, hi = start, p
+            while lo < hi:
+                mid = (lo + hi) // 2
+                self.steps += 1
+                if item[key] < records[mid][key]:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            for q in range(p, lo, -1):
+                records[q] = records[q - 1]
+            records[lo] = item
+
+    def _merge_into(self, src, dst, lo, mid, hi, key):
+        """
+        Merges the sorted ranges src[lo:mid] and src[mid:hi] into dst[lo:hi].
+        Counts each comparison in self.steps.
+        """
+        i, j, k = lo, mid, lo
+        while i < mid and j < hi:
+            self.steps += 1
+            if src[i][key] <= src[j][key]:
+                dst[k] = src[i]
+                i += 1
+            else:
+                dst[k] = src[j]
+                j += 1
+            k += 1
+        while i < mid:
+            dst[k] = src[i]
+            i += 1
+            k += 1
+        while j < hi:
+            dst[k] = src[j]
+            j += 1
+            k += 1
+
+    def external_sort(self, key, records=None, chunk_size=EXTERNAL_CHUNK_SIZE, workers=None, tmpdir=None):
+        """
+        Sorts a record stream that does not fit in memory.
+        The input (any iterable, self.records by default) is cut into chunks that are
+        adaptive-sorted in a process pool and spilled to temporary run files; the runs
+        are then k-way merged through a heap and yielded one record at a time.
+        At most two chunks per worker are in flight. self.steps holds the comparisons
+        of all workers plus the merge once the output has been fully consumed.
+        """
+        if not isinstance(key, (str, int)):
+            raise ValueError("External sort takes a single key")
+        self.steps = 0
+        if records is None:
+            records = self.records
+        workers = workers or os.cpu_count() or 1
+        runs = []
+        submitted = []
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = []
+                chunk = []
+                for record in records:
+                    chunk.append(record)
+                    if len(chunk) == chunk_size:
+                        pending.append(pool.submit(_sort_run, chunk, key, tmpdir))
+                        submitted.append(pending[-1])
+                        chunk = []
+                        if len(pending) >= 2 * workers:
+                            self._collect_run(pending.pop(0), runs)
+                if chunk:
+                    pending.append(pool.submit(_sort_run, chunk, key, tmpdir))
+                    submitted.append(pending[-1])
+                for future in pending:
+                    self._collect_run(future, runs)
+            yield from self._merge_runs(runs, key)
+        finally:
+            # the pool has waited for every worker by now, so on an error this
+            # also finds the run files of futures that were never collected
+            paths = set(runs)
+            for future in submitted:
+                if not future.cancelled() and future.exception() is None:
+                    paths.add(future.result()[0])
+            for path in paths:
+                os.remove(path)
+
+    def _collect_run(self, future, runs):
+        path, steps = future.result()
+        runs.append(path)
+        self.steps += steps
+
+    def _merge_runs(self, runs, key):
+        """
+        k-way merges sorted run files with a heap, counting every heap comparison.
+        Ties go to the earlier run, which keeps the external sort stable.
+        """
+        sorter = self
+
+        class Entry:
+            __slots__ = ("value", "run", "record")
+
+            def __init__(self, record, run):
+                self.value = record[key]
+                self.run = run
+                self.record = record
+
+            def __lt__(self, other):
+                sorter.steps += 1
+                if self.value == other.value:
+                    return self.run < other.run
+                return self.value < other.value
+
+        readers = [_read_run(path) for path in runs]
+        try:
+            heap = []
+            for run, reader in enumerate(readers):
+                record = next(reader, None)
+                if record is not None:
+                    heap.append(Entry(record, run))
+            heapq.heapify(heap)
+            while heap:
+                entry = heap[0]
+                yield entry.record
+                record = next(readers[entry.run], None)
+                if record is None:
+                    heapq.heappop(heap)
+                else:
+                    heapq.heapreplace(heap, Entry(record, entry.run))
+        finally:
+            # close the run files before external_sort deletes them, also when
+            # the consumer stops early
+            for reader in readers:
+                reader.close()
+
+    def extract_keys(self, key):
+        """
+        Pulls the sort key out of every record once.
+        Date fields become an array of integer day ordinals, other fields a list of values.
+        """
+        if key in DATE_KEYS:
+            return array("l", (date.fromisoformat(record[key]).toordinal() for record in self.records))
+        return [record[key] for record in self.records]
+
+    def composite_keys(self, keys):
+        """
+        Builds one integer sort key per record from several (field, descending) pairs.
+        Each field is replaced by its dense rank among the distinct values (flipped
+        for descending fields) and the ranks are combined in mixed radix, so the
+        whole multi-key ordering is a single integer comparison.
+        """
+        composite = [0] * len(self.records)
+        for field, descending in keys:
+            values = self.extract_keys(field)
+            ranks = {value: rank for rank, value in enumerate(sorted(set(values)))}
+            radix = len(ranks)
+            for i, value in enumerate(values):
+                rank = ranks[value]
+                if descending:
+                    rank = radix - 1 - rank
+                composite[i] = composite[i] * radix + rank
+        return composite
+
+    def sort_with_metrics(self, method="bubble", key="admission_date", cache_keys=False):
+        """
+        Sorts with the chosen method and reports the comparison count.
+        With cache_keys the keys are extracted once (decorate-sort-undecorate): the
+        algorithm sorts (key, position) pairs and the records are reordered once at the end.
+        key may also be a list of fields or (field, "asc"/"desc") pairs, e.g.
+        ["last_name", "first_name", ("admission_date", "desc")]; the fields are
+        folded into one composite key so the ordering costs a single sort.
+        """
         n = len(self.records)
-        if method == "bubble":
-            sorted_data = self.bubble_sort(key)
-        elif method == "merge":
-            sorted_data = self.merge_sort(key)
+        sorters = {
+            "bubble": self.bubble_sort,
+            "merge": self.merge_sort,
+            "adaptive": self.adaptive_sort,
+            "external": lambda key, records=None: list(self.external_sort(key, records)),
+        }
+        if method not in sorters:
+            raise ValueError("Method must be 'bubble', 'merge', 'adaptive' or 'external'")
+        if not isinstance(key, str):
+            decorated = list(zip(self.composite_keys(parse_sort_keys(key)), range(n)))
+            sorted_pairs = sorters[method](0, decorated)
+            sorted_data = [self.records[i] for _, i in sorted_pairs]
+        elif cache_keys:
+            decorated = list(zip(self.extract_keys(key), range(n)))
+            sorted_pairs = sorters[method](0, decorated)
+            sorted_data = [self.records[i] for _, i in sorted_pairs]
         else:
-            raise ValueError("Method must be 'bubble' or 'merge'")
+            sorted_data = sorters[method](key)
         
         return {
             "n": n,
             "steps": self.steps,
             "key": key,
             "sorted_data": sorted_data,
-            "sort_method" : method
+            "sort_method" : method,
+            "cache_keys": cache_keys
     }
 
+    def compare_key_caching(self, method="merge", key="admission_date"):
+        """
+        Times the same sort with per-comparison dict lookups and with cached keys.
+        Returns both wall-clock times in ms and the speedup of the cached version.
+        """
+        t0 = time.perf_counter()
+        self.sort_with_metrics(method, key)
+        direct_ms = (time.perf_counter() - t0) * 1e3
+        t0 = time.perf_counter()
+        self.sort_with_metrics(method, key, cache_keys=True)
+        cached_ms = (time.perf_counter() - t0) * 1e3
+        return {
+            "n": len(self.records),
+            "sort_method": method,
+            "key": key,
+            "direct_ms": direct_ms,
+            "cached_ms": cached_ms,
+            "speedup": direct_ms / cached_ms if cached_ms else float("inf"),
+        }
+
+def _sort_run(chunk, key, tmpdir):
+    """
+    Process pool worker for external_sort: sorts one chunk and spills it to a run file.
+    Returns the run file path and the number of comparisons made.
+    """
+    sorter = PatientRecord(chunk)
+    sorted_chunk = sorter.adaptive_sort(key)
+    fd, path = tempfile.mkstemp(suffix=".run", dir=tmpdir)
+    # one pickle per record: a shared Pickler/Unpickler memo would keep every
+    # record of the run alive until the reader finishes
+    with os.fdopen(fd, "wb") as f:
+        for record in sorted_chunk:
+            pickle.dump(record, f, pickle.HIGHEST_PROTOCOL)
+    return path, sorter.steps
+
+def _read_run(path):
+    with open(path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+def parse_sort_keys(keys):
+    """
+    Normalizes a list of sort keys into (field, descending) pairs.
+    Each entry is a field name (ascending) or a (field, "asc"/"desc") pair.
+    """
+    parsed = []
+    for spec in keys:
+        if isinstance(spec, str):
+            parsed.append((spec, False))
+        else:
+            field, direction = spec
+            if direction not in ("asc", "desc"):
+                raise ValueError("Sort direction must be 'asc' or 'desc'")
+            parsed.append((field, direction == "desc"))
+    if not parsed:
+        raise ValueError("At least one sort key is required")
+    return parsed
+
 def print_sort_results(result):
     GREEN = '\033[92m'
     RESET = '\033[0m'
@@ -96,9 +563,14 @@ def print_sort_results(result):
     #     )
     #     print(f"{{{record_str}}}")
 
+def print_caching_results(result):
+    print(f"{result['sort_method']} sort of {result['n']} records by '{result['key']}': "
+          f"{result['direct_ms']:.2f} ms direct, {result['cached_ms']:.2f} ms with cached keys "
+          f"({result['speedup']:.2f}x)")
+
 def generate_random_patients(n):
-    first_names = ["Ava", "Liam", "Sophia", "Elijah", "Isabella", "Mateo", "Emily", "Noah", "Mia", "Ethan", "Zoe", "Lucas"]
-    last_names = ["Thompson", "Rodriguez", "Patel", "Kim", "Nguyen", "Carter", "Johnson", "Singh", "Lewis", "Martinez", "Brooks", "Clark"]
+    first_names = FIRST_NAMES
+    last_names = LAST_NAMES
     
     def random_date(start, end):
         delta = end - start
@@ -125,8 +597,187 @@ def generate_random_patients(n):
     
     return patients
 
+def generate_patient_batches(n, batch_size=PATIENT_BATCH_SIZE, seed=None, columns=False):
+    """
+    Streams n random patients in batches instead of building one big list.
+    Names and dates are drawn for a whole batch at once from tables of names and
+    preformatted ISO dates: with NumPy as vectorized day offsets into the tables,
+    otherwise with random.choices. Uses the same value ranges
+    as generate_random_patients.
+
+    Args:
+        n (int): Total number of patients.
+        batch_size (int): Patients per yielded batch.
+        seed (int): Seed for reproducible data.
+        columns (bool): Yield {field: list of values} batches instead of lists of dicts.
+    """
+    today = date.today()
+    dob_start, admission_start = date(1900, 1, 1), date(2000, 1, 1)
+    dob_days = (today - dob_start).days + 1
+    admission_days = (today - admission_start).days + 1
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        first_names, last_names = np.array(FIRST_NAMES), np.array(LAST_NAMES)
+        # format every day in each range once; batches then just index by day offset
+        dob_table = np.datetime_as_string(np.datetime64(dob_start.isoformat(), "D") + np.arange(dob_days))
+        admission_table = np.datetime_as_string(
+            np.datetime64(admission_start.isoformat(), "D") + np.arange(admission_days))
+    else:
+        rng = random.Random(seed)
+        dob_table = [(dob_start + timedelta(days=d)).isoformat() for d in range(dob_days)]
+        admission_table = [(admission_start + timedelta(days=d)).isoformat() for d in range(admission_days)]
+
+    for first_id in range(0, n, batch_size):
+        size = min(batch_size, n - first_id)
+        ids = [str(10001 + i) for i in range(first_id, first_id + size)]
+        if np is not None:
+            batch = [
+                ids,
+                first_names[rng.integers(0, len(FIRST_NAMES), size)].tolist(),
+                last_names[rng.integers(0, len(LAST_NAMES), size)].tolist(),
+                dob_table[rng.integers(0, dob_days, size)].tolist(),
+                admission_table[rng.integers(0, admission_days, size)].tolist(),
+            ]
+        else:
+            batch = [
+                ids,
+                rng.choices(FIRST_NAMES, k=size),
+                rng.choices(LAST_NAMES, k=size),
+                rng.choices(dob_table, k=size),
+                rng.choices(admission_table, k=size),
+            ]
+        if columns:
+            yield dict(zip(PATIENT_FIELDS, batch))
+        else:
+            yield [dict(zip(PATIENT_FIELDS, row)) for row in zip(*batch)]
+
+def stream_patients(n, batch_size=PATIENT_BATCH_SIZE, seed=None):
+    """
+    Yields n random patients one at a time, generated in batches.
+    Suitable as the records argument of PatientRecord.external_sort.
+    """
+    return itertools.chain.from_iterable(generate_patient_batches(n, batch_size, seed))
+
+def write_patients_csv(path, n, batch_size=PATIENT_BATCH_SIZE, seed=None):
+    """
+    Writes n random patients to a CSV file without holding more than one batch in memory.
+    """
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(PATIENT_FIELDS)
+        for batch in generate_patient_batches(n, batch_size, seed, columns=True):
+            writer.writerows(zip(*(batch[field] for field in PATIENT_FIELDS)))
+
+def write_patients_columnar(directory, n, batch_size=PATIENT_BATCH_SIZE, seed=None):
+    """
+    Writes n random patients column by column: one file per field in directory,
+    one value per line, so a benchmark can load just the sort key column.
+    """
+    os.makedirs(directory, exist_ok=True)
+    files = {field: open(os.path.join(directory, f"{field}.txt"), "w") for field in PATIENT_FIELDS}
+    try:
+        for batch in generate_patient_batches(n, batch_size, seed, columns=True):
+            for field, values in batch.items():
+                files[field].write("\n".join(values))
+                files[field].write("\n")
+    finally:
+        for f in files.values():
+            f.close()
+
+def make_sort_input(n, distribution, key="last_name", seed=0):
+    """
+    Builds n patients in one of the SORT_DISTRIBUTIONS shapes:
+    random order, already sorted by key, reverse sorted, or random order with
+    only two distinct last names (many duplicate keys).
+    """
+    records = list(stream_patients(n, seed=seed))
+    if distribution == "presorted":
+        records.sort(key=lambda record: record[key])
+    elif distribution == "reversed":
+        records.sort(key=lambda record: record[key], reverse=True)
+    elif distribution == "duplicates":
+        for i, record in enumerate(records):
+            record["last_name"] = LAST_NAMES[i % 2]
+    elif distribution != "random":
+        raise ValueError(f"distribution must be one of {', '.join(SORT_DISTRIBUTIONS)}")
+    return records
+
+def benchmark_sorts(sizes=(100, 1000, 10000, 100000), methods=("bubble", "merge", "adaptive"),
+                    distributions=SORT_DISTRIBUTIONS, key="last_name",
+                    bubble_limit=BUBBLE_SORT_LIMIT, csv_path="sort_benchmark.csv", seed=0):
+    """
+    Sweeps every method over every size and input distribution.
+    Each case is timed once untraced, then run again under tracemalloc for the
+    peak memory; bubble sort is skipped above bubble_limit. Rows are written to
+    csv_path and returned.
+    """
+    rows = []
+    for distribution in distributions:
+        for n in sizes:
+            sorter = PatientRecord(make_sort_input(n, distribution, key, seed))
+            for method in methods:
+                if method == "bubble" and n > bubble_limit:
+                    continue
+                t0 = time.perf_counter()
+                sorter.sort_with_metrics(method, key)
+                time_ms = (time.perf_counter() - t0) * 1e3
+                tracemalloc.start()
+                sorter.sort_with_metrics(method, key)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                rows.append({"sort_method": method, "distribution": distribution, "n": n,
+                             "time_ms": time_ms, "steps": sorter.steps, "peak_kb": peak / 1024})
+                print(f"{distribution:10s} {method:9s} n={n:8d} {time_ms:10.2f} ms "
+                      f"{sorter.steps:12d} steps {peak / 1024:10.1f} KB peak")
+    if csv_path:
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["sort_method", "distribution", "n", "time_ms", "steps", "peak_kb"])
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"Wrote {csv_path}")
+    return rows
+
+def fit_growth(rows, measure="steps"):
+    """
+    Fits measure = c * f(n) by least squares for f(n) = n^2, n log2 n and n, per
+    method and distribution, and reports the model with the lowest relative error.
+    The linear model catches adaptive sorts on presorted input.
+    """
+    models = {"n^2": lambda n: n * n, "n log n": lambda n: n * math.log2(n) if n > 1 else 1, "n": lambda n: n}
+    groups = {}
+    for row in rows:
+        groups.setdefault((row["sort_method"], row["distribution"]), []).append((row["n"], row[measure]))
+    fits = []
+    for (method, distribution), points in groups.items():
+        best = None
+        for model, f in models.items():
+            fx = [f(n) for n, _ in points]
+            c = sum(x * y for x, (_, y) in zip(fx, points)) / sum(x * x for x in fx)
+            # root mean square of the relative residuals, so large n does not dominate
+            error = math.sqrt(sum(((c * x - y) / y) ** 2 for x, (_, y) in zip(fx, points) if y) / len(points))
+            if best is None or error < best["rel_error"]:
+                best = {"sort_method": method, "distribution": distribution, "model": model,
+                        "coefficient": c, "rel_error": error}
+        fits.append(best)
+    return fits
+
+def print_growth_fits(fits):
+    for fit in fits:
+        print(f"{fit['distribution']:10s} {fit['sort_method']:9s} ~ {fit['coefficient']:.3g} * {fit['model']:7s} "
+              f"(relative error {fit['rel_error']:.1%})")
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sort patient records and report comparison counts.")
+    parser.add_argument("--benchmark", action="store_true", help="Sweep sizes and input distributions instead")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--bubble-limit", type=int, default=BUBBLE_SORT_LIMIT)
+    parser.add_argument("--csv", default="sort_benchmark.csv", help="Benchmark results file")
+    args = parser.parse_args()
+    if args.benchmark:
+        rows = benchmark_sorts(args.sizes, bubble_limit=args.bubble_limit, csv_path=args.csv)
+        print_growth_fits(fit_growth(rows))
+        raise SystemExit
     try:
         record_quantity = int(input("Enter number of records to generate: "))
     except ValueError:
@@ -136,3 +787,7 @@ if __name__ == "__main__":
     p_records = PatientRecord(records)
     print_sort_results(p_records.sort_with_metrics("bubble", "last_name"))
     print_sort_results(p_records.sort_with_metrics("merge", "last_name"))
+    print_sort_results(p_records.sort_with_metrics("adaptive", "last_name"))
+    print_caching_results(p_records.compare_key_caching("merge", "admission_date"))
+    print_sort_results(p_records.sort_with_metrics(
+        "adaptive", ["last_name", "first_name", ("admission_date", "desc")]))
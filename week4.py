@@ -1,4 +1,4 @@
-import collections, heapq, struct, time, random, stringx
+import collections, heapq, struct, time, random, string
 from typing import Dict, List,Tuple,Union, Literal
 
 
@@ -1,14 +1,54 @@
+import argparse
 import collections
 import heapq
+import math
+import os
+import statistics
 import struct
 import time
+import tracemalloc
 import random
 import string
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from typing import Dict, Tuple, Union, Literal
 from matplotlib.widgets import CheckButtons
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# bits resolved per decode table lookup, for large and small streams
+DECODE_TABLE_BITS = 12
+DECODE_TABLE_BITS_SMALL = 8
+# longest code the canonical encoder may emit
+MAX_CODE_LEN = 15
+# symbols packed per NumPy pass in huffman_encode_numpy, bounding its scratch memory
+NUMPY_ENCODE_CHUNK = 1 << 18
+# LZSS: shortest/longest match, default window, and per-effort (chain depth,
+# index every matched position) settings for the hash-chain match finder
+LZ_MIN_MATCH = 3
+LZ_MAX_MATCH = 258
+LZ_WINDOW = 1 << 15
+# minimum-length matches farther back than this cost more than the literals
+LZ_TOO_FAR = 4096
+# auto_encode: block size, sampled bytes per block (taken as AUTO_SAMPLE_SLICES
+# evenly spaced slices so runs survive), and per-block frame (codec, payload length)
+AUTO_BLOCK_SIZE = 1 << 16
+AUTO_SAMPLE = 4096
+AUTO_SAMPLE_SLICES = 4
+AUTO_FRAME = struct.Struct(">BI")
+# benchmark runner: dataset seed, untimed warmup calls, timed trials, and the
+# per-measurement time budget after which trials stop early (min repeats kept)
+BENCH_SEED = 506
+BENCH_WARMUP = 1
+BENCH_REPEATS = 7
+BENCH_MIN_REPEATS = 3
+BENCH_BUDGET_S = 1.0
+LZ_EFFORT = {
+    'fast': (4, False),
+    'default': (16, True),
+    'best': (64, True),
+}
 # Existing encoder implementations
 def build_tree_codes(freq: Dict[int, int]) -> Dict[int, Tuple[int, int]]:
     pq = []
@@ -149,6 +189,306 @@ def huffman_encode_opt(data: bytes) -> bytes:
     a(bits)
     return bytes(hdr) + bytes(bitbuf)
 
+
+def huffman_encode_numpy(data: bytes) -> bytes:
+    """
+    NumPy version of huffman_encode_opt with byte-identical output.
+    Symbols are mapped to code/length arrays and expanded to bits in bulk: each
+    code is left-justified in a fixed-width word, unpacked, and only its first
+    len bits are kept, which lays the codes end to end in stream order for
+    np.packbits. Works in NUMPY_ENCODE_CHUNK slices and carries the partial last
+    byte of each slice into the next.
+    """
+    if not data:
+        return b""
+
+    arr = np.frombuffer(data, dtype=np.uint8)
+    freq = np.bincount(arr, minlength=256).tolist()
+    freq_dict = {i: f for i, f in enumerate(freq) if f > 0}
+    codes = build_tree_codes_linear(freq_dict)
+
+    code_ints = np.zeros(256, dtype=np.int64)
+    code_lens = np.zeros(256, dtype=np.int64)
+    for sym, (ci, ln) in codes.items():
+        code_ints[sym] = ci
+        code_lens[sym] = ln
+    max_len = int(code_lens.max())
+
+    # same header as huffman_encode_opt
+    hdr = bytearray([len(codes)])
+    for sym in range(256):
+        if code_lens[sym]:
+            hdr.append(sym)
+            hdr.append(int(code_lens[sym]))
+            hdr.extend((freq[sym] & 0xFFFFFFFF).to_bytes(4, "big"))
+
+    # left-justify every code in the narrowest big-endian word that fits max_len;
+    # unpacking the words to bits and keeping the first len bits of each row gives the stream
+    width = next(w for w in (8, 16, 32, 64) if max_len <= w)
+    word = np.dtype(f">u{width // 8}")
+    keep = np.arange(width) < np.arange(width + 1)[:, None]   # keep[len] masks a row's first len bits
+
+    out = bytearray()
+    carry = np.zeros(0, dtype=np.uint8)
+    for start in range(0, len(arr), NUMPY_ENCODE_CHUNK):
+        syms = arr[start:start + NUMPY_ENCODE_CHUNK]
+        lens = code_lens[syms]
+        justified = (code_ints[syms].astype(np.uint64) << (width - lens).astype(np.uint64)).astype(word)
+        bitmat = np.unpackbits(justified.view(np.uint8)).reshape(-1, width)
+        bitarr = np.concatenate((carry, bitmat[keep[lens]]))
+        whole = len(bitarr) // 8 * 8
+        out.extend(np.packbits(bitarr[:whole]).tobytes())
+        carry = bitarr[whole:]
+
+    bits = len(carry)
+    if bits:
+        out.extend(np.packbits(carry).tobytes())
+    hdr.append(bits)
+    return bytes(hdr) + bytes(out)
+
+
+def _read_huffman_header(blob: bytes):
+    """
+    Parse the huffman_encode / huffman_encode_opt header:
+    [count] count * [sym, len, freq(4 bytes BE)] [valid bits in last byte] bitstream.
+    Returns ([(sym, len, freq), ...] in header order, bitstream, total bit count).
+    """
+    count = blob[0]
+    entries = []
+    pos = 1
+    for _ in range(count):
+        sym, ln = blob[pos], blob[pos + 1]
+        entries.append((sym, ln, int.from_bytes(blob[pos + 2:pos + 6], "big")))
+        pos += 6
+    bits = blob[pos]
+    stream = memoryview(blob)[pos + 1:]
+    total_bits = len(stream) * 8 - ((8 - bits) if bits else 0)
+    return entries, stream, total_bits
+
+
+def _build_decode_table(codes: Dict[int, Tuple[int, int]], table_bits: int):
+    """
+    Build a 2**table_bits entry lookup table for a prefix code.
+    Each entry holds every whole symbol that fits in the window, plus the number
+    of bits they use; a used count of 0 means the first code is longer than the
+    window and must take the slow path. Tables for k-bit windows are built from
+    the (k - len)-bit tables, so each entry costs one lookup.
+    """
+    single = [None] * (1 << table_bits)
+    for sym, (ci, ln) in codes.items():
+        if ln <= table_bits:
+            shift = table_bits - ln
+            for window in range(ci << shift, (ci + 1) << shift):
+                single[window] = (sym, ln)
+    tables = [[(b"", 0)]]
+    for k in range(1, table_bits + 1):
+        shift = table_bits - k
+        row = []
+        for window in range(1 << k):
+            first = single[window << shift]
+            if first is None or first[1] > k:
+                row.append((b"", 0))
+                continue
+            sym, ln = first
+            rest, used = tables[k - ln][window & ((1 << (k - ln)) - 1)]
+            row.append((bytes((sym,)) + rest, ln + used))
+        tables.append(row)
+    return tables[table_bits]
+
+
+def decode_prefix_code(stream, codes: Dict[int, Tuple[int, int]], total_bits: int) -> bytes:
+    """
+    Decode total_bits of a big-endian bitstream written with codes {sym: (code_int, bit_len)}.
+    Uses a multi-symbol lookup table (DECODE_TABLE_BITS bits per lookup) and only
+    falls back to a per-length search for codes longer than the table and the
+    final few bits of the stream.
+    """
+    table_bits = DECODE_TABLE_BITS if total_bits >= 1 << 17 else DECODE_TABLE_BITS_SMALL
+    table = _build_decode_table(codes, table_bits)
+    by_code = {(ln, ci): sym for sym, (ci, ln) in codes.items()}
+    lengths = sorted({ln for _, ln in codes.values()})
+    max_len = lengths[-1] if lengths else 0
+    mask = (1 << table_bits) - 1
+
+    out = bytearray()
+    ext = out.extend
+    acc = nbits = pos = consumed = 0
+    end = len(stream)
+    while consumed < total_bits:
+        # refill up to 7 bytes at a time, then drop bits already consumed
+        if nbits < 56 and pos < end:
+            chunk = stream[pos:pos + 7]
+            acc = ((acc & ((1 << nbits) - 1)) << (8 * len(chunk))) | int.from_bytes(chunk, "big")
+            nbits += 8 * len(chunk)
+            pos += len(chunk)
+        while nbits >= table_bits and total_bits - consumed >= table_bits:
+            syms, used = table[(acc >> (nbits - table_bits)) & mask]
+            if not used:
+                break
+            ext(syms)
+            nbits -= used
+            consumed += used
+        if nbits < table_bits and pos < end:
+            continue
+        if consumed >= total_bits:
+            break
+        # slow path: one symbol from a code longer than the table, or the tail of the stream
+        while nbits < max_len and pos < end:
+            acc = ((acc & ((1 << nbits) - 1)) << 8) | stream[pos]
+            nbits += 8
+            pos += 1
+        for ln in lengths:
+            if ln > total_bits - consumed:
+                raise ValueError("corrupt Huffman bitstream")
+            peek = (acc >> (nbits - ln)) if nbits >= ln else (acc << (ln - nbits))
+            sym = by_code.get((ln, peek & ((1 << ln) - 1)))
+            if sym is not None:
+                out.append(sym)
+                nbits -= ln
+                consumed += ln
+                break
+        else:
+            raise ValueError("corrupt Huffman bitstream")
+    return bytes(out)
+
+
+def huffman_decode(blob: bytes) -> bytes:
+    """
+    Decode huffman_encode output (here or in week4).
+    The header lists symbols in the order the tree walk reached them, left to
+    right, which is increasing code order, so the exact codes follow from the
+    code lengths alone.
+    """
+    if not blob:
+        return b""
+    entries, stream, total_bits = _read_huffman_header(blob)
+    codes = {}
+    code, prev_len = 0, None
+    for sym, ln, _ in entries:
+        if prev_len is not None:
+            code = (code + 1) << (ln - prev_len) if ln >= prev_len else (code + 1) >> (prev_len - ln)
+        codes[sym] = (code, ln)
+        prev_len = ln
+    return decode_prefix_code(stream, codes, total_bits)
+
+
+def huffman_decode_opt(blob: bytes) -> bytes:
+    """
+    Decode huffman_encode_opt output by rebuilding the same code table from the
+    stored frequencies; build_tree_codes_linear is deterministic for a given
+    frequency table.
+    """
+    if not blob:
+        return b""
+    entries, stream, total_bits = _read_huffman_header(blob)
+    codes = build_tree_codes_linear({sym: fr for sym, _, fr in entries})
+    return decode_prefix_code(stream, codes, total_bits)
+
+def limit_code_lengths(lengths: Dict[int, int], freq: Dict[int, int], max_len: int = MAX_CODE_LEN) -> Dict[int, int]:
+    """
+    Cap Huffman code lengths at max_len while keeping a valid prefix code.
+    Over-long codes are clamped, then the Kraft sum is repaired by lengthening
+    the longest codes still under the cap (least frequent first), and any slack
+    left over is spent shortening the most frequent codes.
+    """
+    if not lengths or max(lengths.values()) <= max_len:
+        return dict(lengths)
+    limited = {sym: min(ln, max_len) for sym, ln in lengths.items()}
+    budget = 1 << max_len
+    kraft = sum(1 << (max_len - ln) for ln in limited.values())
+    while kraft > budget:
+        sym = max((s for s in limited if limited[s] < max_len),
+                  key=lambda s: (limited[s], -freq[s]))
+        limited[sym] += 1
+        kraft -= 1 << (max_len - limited[sym])
+    for sym in sorted(limited, key=lambda s: -freq[s]):
+        while limited[sym] > 1 and kraft + (1 << (max_len - limited[sym])) <= budget:
+            kraft += 1 << (max_len - limited[sym])
+            limited[sym] -= 1
+    return limited
+
+
+def canonical_codes(lengths: Dict[int, int]) -> Dict[int, Tuple[int, int]]:
+    """
+    Assign canonical codes: symbols ordered by (length, symbol) get consecutive
+    code values, so the code lengths alone describe the whole table.
+    """
+    codes = {}
+    code, prev_len = 0, 0
+    for sym, ln in sorted(lengths.items(), key=lambda item: (item[1], item[0])):
+        code <<= ln - prev_len
+        codes[sym] = (code, ln)
+        code += 1
+        prev_len = ln
+    return codes
+
+
+def huffman_encode_canonical(data: bytes) -> bytes:
+    """
+    Huffman encode with canonical, length-limited (MAX_CODE_LEN) codes.
+    Header: [symbol count - 1] count * [sym, len] [valid bits in last byte],
+    2 bytes per symbol instead of the 6 that huffman_encode_opt spends on
+    frequencies. The bitstream layout is the same as huffman_encode_opt.
+    """
+    if not data:
+        return b""
+
+    freq = [0] * 256
+    for b in data:
+        freq[b] += 1
+    freq_dict = {i: f for i, f in enumerate(freq) if f > 0}
+    tree_codes = build_tree_codes_linear(freq_dict)
+    lengths = limit_code_lengths({sym: ln for sym, (_, ln) in tree_codes.items()}, freq_dict)
+    codes = canonical_codes(lengths)
+
+    code_ints = [0] * 256
+    code_lens = [0] * 256
+    for sym, (ci, ln) in codes.items():
+        code_ints[sym] = ci
+        code_lens[sym] = ln
+
+    hdr = bytearray()
+    a = hdr.append
+    a(len(codes) - 1)
+    for sym in range(256):
+        if code_lens[sym]:
+            a(sym); a(code_lens[sym])
+
+    bitbuf = bytearray()
+    bb = bitbuf.append
+    cur = 0
+    bits = 0
+    for b in data:
+        cur = (cur << code_lens[b]) | code_ints[b]
+        bits += code_lens[b]
+        while bits >= 8:
+            bits -= 8
+            bb((cur >> bits) & 0xFF)
+        # keep only the unflushed bits so cur stays small
+        cur &= (1 << bits) - 1
+
+    if bits:
+        bb((cur << (8 - bits)) & 0xFF)
+
+    a(bits)
+    return bytes(hdr) + bytes(bitbuf)
+
+
+def huffman_decode_canonical(blob: bytes) -> bytes:
+    """
+    Decode huffman_encode_canonical output; the codes are rebuilt from the lengths.
+    """
+    if not blob:
+        return b""
+    count = blob[0] + 1
+    lengths = {blob[1 + 2 * i]: blob[2 + 2 * i] for i in range(count)}
+    pos = 1 + 2 * count
+    bits = blob[pos]
+    stream = memoryview(blob)[pos + 1:]
+    total_bits = len(stream) * 8 - ((8 - bits) if bits else 0)
+    return decode_prefix_code(stream, canonical_codes(lengths), total_bits)
+
+
 def rle_encode_opt(data: Union[str, bytes]) -> bytes:
     """
     Run‐length encode the input, but only emit runs when the 
@@ -254,6 +594,462 @@ def rle_encode_optimized(data: Union[str, bytes]) -> bytes:
     return bytes(out)
 
 
+def rle_decode(blob: bytes) -> bytes:
+    """
+    Decode the (count, byte) pairs written by rle_encode and rle_encode_optimized.
+    """
+    out = bytearray()
+    for i in range(0, len(blob), 2):
+        out.extend(blob[i + 1:i + 2] * blob[i])
+    return bytes(out)
+
+
+def rle_decode_opt(blob: bytes) -> bytes:
+    """
+    Decode the 0x00 run / 0x01 literal blocks written by rle_encode_opt
+    (and by rle_encode in week4, which uses the same markers).
+    """
+    out = bytearray()
+    i, n = 0, len(blob)
+    while i < n:
+        marker, length = blob[i], blob[i + 1]
+        if marker == 0x00:
+            out.extend(blob[i + 2:i + 3] * length)
+            i += 3
+        elif marker == 0x01:
+            out.extend(blob[i + 2:i + 2 + length])
+            i += 2 + length
+        else:
+            raise ValueError(f"bad RLE marker {marker:#x} at offset {i}")
+    return bytes(out)
+
+
+def _byte_runs(data: bytes, max_len: int = 0):
+    """
+    Find every run of equal bytes in one NumPy pass (a diff over the buffer).
+    Returns (starts, lengths, values) arrays. With max_len, longer runs are
+    cut into max_len pieces plus a remainder, matching how the per-byte
+    encoders measure at most 255 bytes at a time.
+    """
+    arr = np.frombuffer(data, dtype=np.uint8)
+    if not len(arr):
+        return arr.astype(np.int64), arr.astype(np.int64), arr
+    starts = np.concatenate(([0], np.flatnonzero(arr[1:] != arr[:-1]) + 1))
+    lengths = np.diff(np.append(starts, len(arr)))
+    if max_len and lengths.max() > max_len:
+        pieces = (lengths + max_len - 1) // max_len
+        last = np.cumsum(pieces) - 1
+        first = np.repeat(last - pieces + 1, pieces)
+        run_lengths = lengths
+        starts = np.repeat(starts, pieces) + (np.arange(last[-1] + 1) - first) * max_len
+        lengths = np.full(len(starts), max_len)
+        lengths[last] = run_lengths - max_len * (pieces - 1)
+    return starts, lengths, arr[starts]
+
+
+def _marker_rle(data: bytes, runs, min_run: int) -> bytes:
+    """
+    Write the 0x00 run / 0x01 literal format from precomputed runs: every run
+    of at least min_run bytes becomes run blocks (split at 255) and the bytes
+    between them are copied as literal blocks of up to 255 bytes.
+    """
+    starts, lengths, values = runs
+    keep = lengths >= min_run
+    out = bytearray()
+    pending = 0
+    for start, length, value in zip(starts[keep].tolist(), lengths[keep].tolist(), values[keep].tolist()):
+        for pos in range(pending, start, 255):
+            chunk = data[pos:min(pos + 255, start)]
+            out.extend((0x01, len(chunk)))
+            out.extend(chunk)
+        pending = start + length
+        while length > 0:
+            chunk = min(length, 255)
+            out.extend((0x00, chunk, value))
+            length -= chunk
+    for pos in range(pending, len(data), 255):
+        chunk = data[pos:pos + 255]
+        out.extend((0x01, len(chunk)))
+        out.extend(chunk)
+    return bytes(out)
+
+
+def rle_encode_fast(data: Union[str, bytes]) -> bytes:
+    """
+    Same output as rle_encode / rle_encode_optimized, but run boundaries come
+    from _byte_runs and the (count, byte) pairs are written as two interleaved
+    arrays instead of one byte at a time.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    starts, lengths, values = _byte_runs(data, 255)
+    out = np.empty(2 * len(starts), dtype=np.uint8)
+    out[0::2] = lengths
+    out[1::2] = values
+    return out.tobytes()
+
+
+def rle_encode_opt_fast(data: Union[str, bytes]) -> bytes:
+    """
+    Same output as rle_encode_opt. Runs are measured in 255-byte pieces and a
+    piece is worth a run block once it beats the 3-byte overhead (4+ bytes);
+    only those pieces are visited in Python, literals are sliced in bulk.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return _marker_rle(data, _byte_runs(data, 255), 4)
+
+
+def rle_encode_min_run_fast(data: Union[str, bytes], min_run: int = 3) -> bytes:
+    """
+    Same output as week4's rle_encode(data, min_run=...): runs are measured
+    unbounded, so a long run qualifies as a whole and is then split at 255.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return _marker_rle(data, _byte_runs(data), min_run)
+
+
+def rle_decode_fast(blob: bytes) -> bytes:
+    """
+    Vectorized rle_decode: repeat every byte by its count in one NumPy call.
+    """
+    pairs = np.frombuffer(blob, dtype=np.uint8)
+    return np.repeat(pairs[1::2], pairs[0::2]).tobytes()
+
+
+def _match_len(data: bytes, cand: int, i: int, limit: int) -> int:
+    """
+    Length of the common prefix of data[cand:] and data[i:], up to limit.
+    Both positions are known to share their first LZ_MIN_MATCH bytes.
+    """
+    if data[cand:cand + limit] == data[i:i + limit]:
+        return limit
+    n = LZ_MIN_MATCH
+    while n + 16 <= limit and data[cand + n:cand + n + 16] == data[i + n:i + n + 16]:
+        n += 16
+    while n < limit and data[cand + n] == data[i + n]:
+        n += 1
+    return n
+
+
+def _distance_code(dist: int) -> Tuple[int, int, int]:
+    """
+    Split a match distance into (symbol, extra bit count, extra bits):
+    symbol c covers distances 2**(c-1)+1 .. 2**c and the extra bits pick one.
+    """
+    d = dist - 1
+    c = d.bit_length()
+    if c < 2:
+        return c, 0, 0
+    return c, c - 1, d - (1 << (c - 1))
+
+
+def lzss_tokens(data: bytes, window: int = LZ_WINDOW, effort: str = 'default'):
+    """
+    Greedy LZSS parse with a hash-chain index over the last `window` bytes.
+    Returns a list of tokens: a byte value for a literal, or a (length, distance)
+    tuple for a match. `effort` picks an LZ_EFFORT entry: how many chain
+    candidates to try per position and whether positions inside a match are
+    indexed too.
+    """
+    max_chain, index_all = LZ_EFFORT[effort]
+    n = len(data)
+    head = {}
+    prev = [-1] * n
+    tokens = []
+    i = 0
+    while i < n:
+        best_len = best_dist = 0
+        if i + LZ_MIN_MATCH <= n:
+            key = data[i:i + LZ_MIN_MATCH]
+            limit = min(LZ_MAX_MATCH, n - i)
+            cand = head.get(key, -1)
+            chain = max_chain
+            while cand >= 0 and i - cand <= window and chain:
+                # a longer match must at least agree on the byte after the current best
+                if data[cand + best_len] == data[i + best_len]:
+                    length = _match_len(data, cand, i, limit)
+                    if length > best_len:
+                        best_len, best_dist = length, i - cand
+                        if length == limit:
+                            break
+                cand = prev[cand]
+                chain -= 1
+            prev[i] = head.get(key, -1)
+            head[key] = i
+        if best_len > LZ_MIN_MATCH or (best_len == LZ_MIN_MATCH and best_dist <= LZ_TOO_FAR):
+            tokens.append((best_len, best_dist))
+            if index_all:
+                for j in range(i + 1, min(i + best_len, n - LZ_MIN_MATCH + 1)):
+                    key = data[j:j + LZ_MIN_MATCH]
+                    prev[j] = head.get(key, -1)
+                    head[key] = j
+            i += best_len
+        else:
+            tokens.append(data[i])
+            i += 1
+    return tokens
+
+
+def _lz_code_lengths(freq: Dict[int, int]) -> Dict[int, int]:
+    if not freq:
+        return {}
+    tree_codes = build_tree_codes_linear(freq)
+    return limit_code_lengths({sym: ln for sym, (_, ln) in tree_codes.items()}, freq)
+
+
+def lzss_encode(data: bytes, window: int = LZ_WINDOW, effort: str = 'default') -> bytes:
+    """
+    LZSS followed by canonical Huffman coding of the tokens.
+    Literals are symbols 0-255 and a match of length L is symbol 256 + L - 3 in
+    the same alphabet, followed by its distance symbol (second alphabet) and the
+    distance's extra bits. Both code tables come from build_tree_codes_linear,
+    length-limited to MAX_CODE_LEN.
+    Header: [litlen count, 2 bytes] count * [sym (2 bytes), len]
+            [dist count] count * [sym, len] [valid bits in last byte] bitstream.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if not data:
+        return b""
+    data = bytes(data)
+    tokens = lzss_tokens(data, window, effort)
+
+    lit_freq = collections.Counter()
+    dist_freq = collections.Counter()
+    for tok in tokens:
+        if isinstance(tok, int):
+            lit_freq[tok] += 1
+        else:
+            lit_freq[256 + tok[0] - LZ_MIN_MATCH] += 1
+            dist_freq[_distance_code(tok[1])[0]] += 1
+    lit_lengths = _lz_code_lengths(lit_freq)
+    dist_lengths = _lz_code_lengths(dist_freq)
+    lit_codes = canonical_codes(lit_lengths)
+    dist_codes = canonical_codes(dist_lengths)
+
+    out = bytearray(len(lit_lengths).to_bytes(2, "big"))
+    for sym in sorted(lit_lengths):
+        out.extend(sym.to_bytes(2, "big"))
+        out.append(lit_lengths[sym])
+    out.append(len(dist_lengths))
+    for sym in sorted(dist_lengths):
+        out.extend((sym, dist_lengths[sym]))
+
+    bitbuf = bytearray()
+    bb = bitbuf.append
+    cur = 0
+    bits = 0
+    for tok in tokens:
+        if isinstance(tok, int):
+            ci, ln = lit_codes[tok]
+            cur = (cur << ln) | ci
+            bits += ln
+        else:
+            ci, ln = lit_codes[256 + tok[0] - LZ_MIN_MATCH]
+            sym, extra_len, extra = _distance_code(tok[1])
+            di, dl = dist_codes[sym]
+            cur = (((((cur << ln) | ci) << dl) | di) << extra_len) | extra
+            bits += ln + dl + extra_len
+        while bits >= 8:
+            bits -= 8
+            bb((cur >> bits) & 0xFF)
+        cur &= (1 << bits) - 1
+
+    if bits:
+        bb((cur << (8 - bits)) & 0xFF)
+
+    out.append(bits)
+    return bytes(out) + bytes(bitbuf)
+
+
+def lzss_encode_fast(data: bytes) -> bytes:
+    return lzss_encode(data, effort='fast')
+
+
+def lzss_encode_best(data: bytes) -> bytes:
+    return lzss_encode(data, effort='best')
+
+
+def _lookup_table(codes: Dict[int, Tuple[int, int]]):
+    """
+    Single-symbol lookup table indexed by the next max-code-length bits.
+    Returns (table of (sym, len), table bits).
+    """
+    table_bits = max((ln for _, ln in codes.values()), default=1)
+    table = [(0, 0)] * (1 << table_bits)
+    for sym, (ci, ln) in codes.items():
+        shift = table_bits - ln
+        table[ci << shift:(ci + 1) << shift] = [(sym, ln)] * (1 << shift)
+    return table, table_bits
+
+
+def lzss_decode(blob: bytes) -> bytes:
+    """
+    Decode lzss_encode output (any window or effort).
+    """
+    if not blob:
+        return b""
+    count = int.from_bytes(blob[0:2], "big")
+    lit_lengths = {int.from_bytes(blob[2 + 3 * i:4 + 3 * i], "big"): blob[4 + 3 * i] for i in range(count)}
+    pos = 2 + 3 * count
+    count = blob[pos]
+    dist_lengths = {blob[pos + 1 + 2 * i]: blob[pos + 2 + 2 * i] for i in range(count)}
+    pos += 1 + 2 * count
+    bits = blob[pos]
+    stream = memoryview(blob)[pos + 1:]
+    total_bits = len(stream) * 8 - ((8 - bits) if bits else 0)
+
+    lit_table, lit_bits = _lookup_table(canonical_codes(lit_lengths))
+    dist_table, dist_bits = _lookup_table(canonical_codes(dist_lengths))
+    lit_mask = (1 << lit_bits) - 1
+    dist_mask = (1 << dist_bits) - 1
+
+    out = bytearray()
+    acc = nbits = pos = consumed = 0
+    end = len(stream)
+    while consumed < total_bits:
+        # one token needs at most 3 * MAX_CODE_LEN bits plus distance extra bits
+        if nbits < 56 and pos < end:
+            chunk = stream[pos:pos + 7]
+            acc = ((acc & ((1 << nbits) - 1)) << (8 * len(chunk))) | int.from_bytes(chunk, "big")
+            nbits += 8 * len(chunk)
+            pos += len(chunk)
+        peek = acc >> (nbits - lit_bits) if nbits >= lit_bits else acc << (lit_bits - nbits)
+        sym, ln = lit_table[peek & lit_mask]
+        if not ln or ln > total_bits - consumed:
+            raise ValueError("corrupt LZSS bitstream")
+        nbits -= ln
+        consumed += ln
+        if sym < 256:
+            out.append(sym)
+            continue
+        length = sym - 256 + LZ_MIN_MATCH
+        peek = acc >> (nbits - dist_bits) if nbits >= dist_bits else acc << (dist_bits - nbits)
+        code, ln = dist_table[peek & dist_mask]
+        if not ln:
+            raise ValueError("corrupt LZSS bitstream")
+        nbits -= ln
+        extra_len = code - 1 if code >= 2 else 0
+        nbits -= extra_len
+        consumed += ln + extra_len
+        if code < 2:
+            dist = code + 1
+        else:
+            dist = (1 << (code - 1)) + ((acc >> nbits) & ((1 << extra_len) - 1)) + 1
+        if dist > len(out):
+            raise ValueError("corrupt LZSS bitstream")
+        start = len(out) - dist
+        if dist >= length:
+            out += out[start:start + length]
+        else:
+            # overlapping copy repeats the last dist bytes
+            out += (out[start:] * (length // dist + 1))[:length]
+    return bytes(out)
+
+
+def _sample_block(block: bytes) -> bytes:
+    if len(block) <= AUTO_SAMPLE:
+        return block
+    step = len(block) // AUTO_SAMPLE_SLICES
+    width = AUTO_SAMPLE // AUTO_SAMPLE_SLICES
+    return b"".join(block[i * step:i * step + width] for i in range(AUTO_SAMPLE_SLICES))
+
+
+def block_stats(sample: bytes) -> Tuple[float, float]:
+    """
+    Order-0 entropy (bits per byte) and mean run length of a sample, from the
+    same 256-entry frequency array huffman_encode_opt builds.
+    """
+    freq = [0] * 256
+    for b in sample:
+        freq[b] += 1
+    n = len(sample)
+    entropy = -sum(f / n * math.log2(f / n) for f in freq if f)
+    runs = 1 + sum(a != b for a, b in zip(sample, sample[1:]))
+    return entropy, n / runs
+
+
+def choose_codec(block: bytes) -> int:
+    """
+    Pick the AUTO_CODECS id expected to give the smallest output for block,
+    estimated from a sample: Huffman costs about entropy/8 per byte plus a
+    2-byte header entry per symbol; rle_encode_opt costs 3 bytes per run once
+    runs reach 4 bytes and slightly more than raw below that.
+    """
+    if not block:
+        return 0
+    sample = _sample_block(block)
+    entropy, mean_run = block_stats(sample)
+    n = len(block)
+    huffman = n * max(entropy, 1.0) / 8 + 2 * len(set(sample)) + 2
+    rle = n * (3 / mean_run if mean_run >= 4 else 1 + 2 / 255)
+    best = min(huffman, rle)
+    if best >= n:
+        return 0
+    return 1 if huffman <= rle else 2
+
+
+def _store_raw(block: bytes) -> bytes:
+    return bytes(block)
+
+
+# codec ids written in each auto_encode frame; append only
+AUTO_CODECS = (
+    (_store_raw, _store_raw),
+    (huffman_encode_canonical, huffman_decode_canonical),
+    (rle_encode_opt_fast, rle_decode_opt),
+)
+
+
+def auto_encode(data: bytes, block_size: int = AUTO_BLOCK_SIZE) -> bytes:
+    """
+    Encode each block_size block with the codec choose_codec picks from a
+    sample, so only one encoder runs per block. A block whose output still
+    comes out larger than the input is stored raw.
+    Output: per block [codec id, payload length (4 bytes BE)] payload.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    out = bytearray()
+    for i in range(0, len(data), block_size):
+        block = data[i:i + block_size]
+        codec = choose_codec(block)
+        payload = AUTO_CODECS[codec][0](block)
+        if len(payload) >= len(block):
+            codec, payload = 0, bytes(block)
+        out.extend(AUTO_FRAME.pack(codec, len(payload)))
+        out.extend(payload)
+    return bytes(out)
+
+
+def auto_choices(blob: bytes):
+    """
+    Codec names chosen for each block of an auto_encode stream.
+    """
+    names = []
+    pos = 0
+    while pos < len(blob):
+        codec, length = AUTO_FRAME.unpack_from(blob, pos)
+        names.append(AUTO_CODECS[codec][0].__name__)
+        pos += AUTO_FRAME.size + length
+    return names
+
+
+def auto_decode(blob: bytes) -> bytes:
+    out = bytearray()
+    pos = 0
+    while pos < len(blob):
+        codec, length = AUTO_FRAME.unpack_from(blob, pos)
+        if codec >= len(AUTO_CODECS):
+            raise ValueError(f"unknown auto codec {codec} at offset {pos}")
+        pos += AUTO_FRAME.size
+        out.extend(AUTO_CODECS[codec][1](blob[pos:pos + length]))
+        pos += length
+    return bytes(out)
+
+
 def make_bitmap(w: int, h: int, pattern: Literal['checker','stripes','random']='checker') -> bytes:
     if pattern == 'checker':
         return bytes(((x ^ y) & 1) for y in range(h) for x in range(w))
@@ -265,6 +1061,91 @@ def make_bitmap(w: int, h: int, pattern: Literal['checker','stripes','random']='
         raise ValueError("pattern must be 'checker','stripes', or 'random'")
 
 
+def make_bitmap_packed(w: int, h: int, pattern: Literal['checker','stripes','random']='checker',
+                       seed: int = None) -> bytes:
+    """
+    Same pixels as make_bitmap, built as a NumPy array and packed 8 pixels per
+    byte (MSB first, row-major, last byte zero padded) with packbits.
+    """
+    y, x = np.indices((h, w), dtype=np.uint8)
+    if pattern == 'checker':
+        pixels = (x ^ y) & 1
+    elif pattern == 'stripes':
+        pixels = y & 1
+    elif pattern == 'random':
+        pixels = np.random.default_rng(seed).integers(0, 2, size=(h, w), dtype=np.uint8)
+    else:
+        raise ValueError("pattern must be 'checker','stripes', or 'random'")
+    return np.packbits(pixels).tobytes()
+
+
+def pack_bitmap(pixels: bytes) -> bytes:
+    """
+    Pack a make_bitmap byte-per-pixel stream; unpack_bitmap reverses it.
+    """
+    return np.packbits(np.frombuffer(pixels, dtype=np.uint8)).tobytes()
+
+
+def unpack_bitmap(packed: bytes, n: int) -> bytes:
+    return np.unpackbits(np.frombuffer(packed, dtype=np.uint8), count=n).tobytes()
+
+
+def _write_varints(values) -> bytes:
+    """
+    LEB128 varints (7 bits per byte, high bit set on all but the last byte),
+    written for the whole array at once.
+    """
+    values = np.asarray(values, dtype=np.uint64)
+    width = np.ones(len(values), dtype=np.int64)
+    rest = values >> np.uint64(7)
+    while rest.any():
+        width += rest > 0
+        rest >>= np.uint64(7)
+    offsets = np.cumsum(width) - width
+    out = np.empty(int(width.sum()), dtype=np.uint8)
+    for k in range(int(width.max(initial=0))):
+        sel = width > k
+        low = (values[sel] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        out[offsets[sel] + k] = low | ((width[sel] > k + 1).astype(np.uint64) << np.uint64(7))
+    return out.tobytes()
+
+
+def _read_varints(blob: bytes):
+    data = np.frombuffer(blob, dtype=np.uint8)
+    last = data < 0x80
+    if len(data) and not last[-1]:
+        raise ValueError("truncated varint")
+    group = np.cumsum(last) - last
+    first = np.concatenate(([0], np.flatnonzero(last)[:-1] + 1))
+    shift = (np.arange(len(data)) - first[group]) * 7
+    values = np.zeros(int(last.sum()), dtype=np.uint64)
+    np.add.at(values, group, (data & 0x7F).astype(np.uint64) << shift.astype(np.uint64))
+    return values
+
+
+def bitrun_encode(packed: bytes) -> bytes:
+    """
+    RLE over the bits of a packed bitmap: the lengths of alternating runs of
+    0 and 1 bits, starting with a (possibly empty) run of 0s, as varints.
+    The padding bits of the last byte are encoded too, so decoding gives back
+    the packed bytes exactly.
+    """
+    bits = np.unpackbits(np.frombuffer(packed, dtype=np.uint8))
+    if not len(bits):
+        return b""
+    edges = np.flatnonzero(bits[1:] != bits[:-1]) + 1
+    runs = np.diff(np.concatenate(([0], edges, [len(bits)])))
+    if bits[0]:
+        runs = np.concatenate(([0], runs))
+    return _write_varints(runs)
+
+
+def bitrun_decode(blob: bytes) -> bytes:
+    runs = _read_varints(blob)
+    bits = np.repeat((np.arange(len(runs)) & 1).astype(np.uint8), runs.astype(np.int64))
+    return np.packbits(bits).tobytes()
+
+
 def make_text(n: int, repetitive: bool=False) -> bytes:
     if repetitive:
         letters = (string.ascii_uppercase + ' ').encode()
@@ -280,19 +1161,222 @@ def make_text(n: int, repetitive: bool=False) -> bytes:
         return bytes(random.choice(letters) for _ in range(n))
 
 
-def benchmark_encoder(encoder, data):
-    t0 = time.perf_counter()
-    out = encoder(data)
-    dt = (time.perf_counter() - t0) * 1e3
-    return len(data), len(out), len(out)/len(data), dt
+# encoder name -> decoder, for round-trip checks and decode timing
+DECODERS = {
+    'huffman_encode': huffman_decode,
+    'huffman_encode_opt': huffman_decode_opt,
+    'huffman_encode_canonical': huffman_decode_canonical,
+    'huffman_encode_numpy': huffman_decode_opt,
+    'rle_encode': rle_decode,
+    'rle_encode_optimized': rle_decode,
+    'rle_encode_opt': rle_decode_opt,
+    'rle_encode_fast': rle_decode_fast,
+    'rle_encode_opt_fast': rle_decode_opt,
+    'rle_encode_min_run_fast': rle_decode_opt,
+    'lzss_encode': lzss_decode,
+    'lzss_encode_fast': lzss_decode,
+    'lzss_encode_best': lzss_decode,
+    'auto_encode': auto_decode,
+    'bitrun_encode': bitrun_decode,
+}
+
+
+def time_trials(func, arg, repeats: int = BENCH_REPEATS, warmup: int = BENCH_WARMUP):
+    """
+    Call func(arg) warmup times untimed, then time up to `repeats` calls.
+    Stops early once BENCH_BUDGET_S has passed and BENCH_MIN_REPEATS calls are in,
+    so the slow reference encoders do not dominate a run.
+    Returns the per-call times in ms.
+    """
+    for _ in range(warmup):
+        func(arg)
+    times = []
+    start = time.perf_counter()
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        func(arg)
+        times.append((time.perf_counter() - t0) * 1e3)
+        if len(times) >= BENCH_MIN_REPEATS and time.perf_counter() - start > BENCH_BUDGET_S:
+            break
+    return times
+
+
+def median_iqr(times):
+    if len(times) < 2:
+        return times[0], 0.0
+    q1, _, q3 = statistics.quantiles(times, n=4)
+    return statistics.median(times), q3 - q1
 
 
+def peak_memory_kb(func, arg) -> float:
+    """
+    Peak memory traced while running func(arg) once, in KB. Runs separately
+    from the timed trials because tracing slows allocation down.
+    """
+    tracemalloc.start()
+    try:
+        func(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def benchmark_runner(encoder, data, repeats: int = BENCH_REPEATS, warmup: int = BENCH_WARMUP):
+    """
+    Repeated-trial benchmark of one encoder on data, with a round-trip check.
+    Returns a dict with the results.csv fields: output_size, ratio, time_ms
+    (median), time_iqr_ms, mb_s (input MB per second at the median),
+    peak_kb, repeats, and decode_ms / decode_iqr_ms (None without a decoder).
+    """
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1")
+    blob = encoder(data)
+    times = time_trials(encoder, data, repeats, warmup)
+    time_ms, time_iqr_ms = median_iqr(times)
+    row = {
+        'output_size': len(blob),
+        'ratio': len(blob) / len(data),
+        'time_ms': time_ms,
+        'time_iqr_ms': time_iqr_ms,
+        'mb_s': len(data) / time_ms / 1e3 if time_ms else float('inf'),
+        'peak_kb': peak_memory_kb(encoder, data),
+        'repeats': len(times),
+        'decode_ms': None,
+        'decode_iqr_ms': None,
+    }
+    decoder = DECODERS.get(encoder.__name__)
+    if decoder is not None:
+        if decoder(blob) != data:
+            # not an assert, so the check survives python -O
+            raise AssertionError(f"{encoder.__name__} round trip failed")
+        row['decode_ms'], row['decode_iqr_ms'] = median_iqr(time_trials(decoder, blob, repeats, warmup))
+    return row
+
+
+# block container: magic, codec id, block size, block count, raw size, then
+# one (payload offset, payload length, raw length) index entry per block
+BLOCK_MAGIC = b"HBLK"
+BLOCK_HEADER = struct.Struct(">4sBIIQ")
+BLOCK_ENTRY = struct.Struct(">QII")
+BLOCK_SIZE = 1 << 20
+# codec id -> encoder; only append so ids in existing files stay valid
+BLOCK_CODECS = (
+    huffman_encode_canonical,
+    huffman_encode_opt,
+    huffman_encode_numpy,
+    huffman_encode,
+    rle_encode,
+    rle_encode_opt,
+    rle_encode_fast,
+    rle_encode_opt_fast,
+    lzss_encode,
+    auto_encode,
+)
+# codecs new containers and streams may be written with: they take any byte
+# values in time linear in the block size. huffman_encode/_opt/_numpy keep the
+# symbol count in one byte (and the first two are quadratic), so their ids above
+# are only decoded
+WRITABLE_CODECS = (huffman_encode_canonical, rle_encode_fast, rle_encode_opt_fast, lzss_encode, auto_encode)
+
+
+def _map_blocks(func, blocks, workers):
+    if workers == 1 or len(blocks) < 2:
+        return [func(block) for block in blocks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, blocks))
+
+
+def block_compress(data: bytes, encoder=huffman_encode_canonical, block_size: int = BLOCK_SIZE,
+                   workers: int = None) -> bytes:
+    """
+    Split data into independent block_size blocks, each with its own code table,
+    and encode them in a process pool (workers=1 encodes in-process).
+    The index of block offsets lets block_decompress work in parallel and
+    read_block decode any single block.
+    """
+    if encoder not in WRITABLE_CODECS:
+        raise ValueError(f"{encoder.__name__} cannot be used in a block container")
+    if not isinstance(data, bytes):
+        data = bytes(data)
+    blocks = [data[i:i + block_size] for i in range(0, len(data), block_size)]
+    payloads = _map_blocks(encoder, blocks, workers)
+    out = bytearray(BLOCK_HEADER.pack(BLOCK_MAGIC, BLOCK_CODECS.index(encoder), block_size,
+                                      len(blocks), len(data)))
+    offset = 0
+    for block, payload in zip(blocks, payloads):
+        out.extend(BLOCK_ENTRY.pack(offset, len(payload), len(block)))
+        offset += len(payload)
+    for payload in payloads:
+        out.extend(payload)
+    return bytes(out)
+
+
+def _block_index(blob: bytes):
+    """
+    Returns (decoder, [(start, end) of each payload in blob]).
+    """
+    magic, codec, _, count, _ = BLOCK_HEADER.unpack_from(blob, 0)
+    if magic != BLOCK_MAGIC or codec >= len(BLOCK_CODECS):
+        raise ValueError("not a block container")
+    base = BLOCK_HEADER.size + count * BLOCK_ENTRY.size
+    spans = []
+    for i in range(count):
+        offset, length, _ = BLOCK_ENTRY.unpack_from(blob, BLOCK_HEADER.size + i * BLOCK_ENTRY.size)
+        spans.append((base + offset, base + offset + length))
+    return DECODERS[BLOCK_CODECS[codec].__name__], spans
+
 
-def phase_one():
+def block_decompress(blob: bytes, workers: int = None) -> bytes:
+    decoder, spans = _block_index(blob)
+    return b"".join(_map_blocks(decoder, [blob[start:end] for start, end in spans], workers))
+
+
+def read_block(blob: bytes, i: int) -> bytes:
+    """
+    Decode only block i of a block container.
+    """
+    decoder, spans = _block_index(blob)
+    start, end = spans[i]
+    return decoder(blob[start:end])
+
+
+def benchmark_block_scaling(data: bytes, encoder=huffman_encode_canonical, block_size: int = BLOCK_SIZE,
+                            core_counts=None):
+    """
+    Time block_compress and block_decompress for each worker count and print the
+    speedup over one worker. Returns [(workers, compress_ms, decompress_ms)].
+    """
+    core_counts = core_counts or sorted({1, 2, 4, os.cpu_count() or 1})
+    results = []
+    for workers in core_counts:
+        t0 = time.perf_counter()
+        blob = block_compress(data, encoder, block_size, workers)
+        compress_ms = (time.perf_counter() - t0) * 1e3
+        t0 = time.perf_counter()
+        out = block_decompress(blob, workers)
+        decompress_ms = (time.perf_counter() - t0) * 1e3
+        assert out == data, "block container round trip failed"
+        results.append((workers, compress_ms, decompress_ms))
+        print(f"{workers:3d} workers  compress={compress_ms:9.1f}ms (x{results[0][1] / compress_ms:4.2f})  "
+              f"decompress={decompress_ms:9.1f}ms (x{results[0][2] / decompress_ms:4.2f})  "
+              f"ratio={len(blob) / len(data):.2f}")
+    return results
+
+
+def phase_one(repeats: int = BENCH_REPEATS, seed: int = BENCH_SEED):
+    """
+    Benchmark every encoder on every dataset and write results.csv.
+    Each (pattern, size) dataset is generated from random.seed(seed), so runs
+    with the same seed compare the same bytes.
+    """
     sizes = [2**k for k in range(10, 17)]  # 1 KB to 64 KB
     patterns = [
         ('striped_bitmap', lambda n: make_bitmap(int(n**0.5), int(n**0.5), 'stripes')),
         ('random_bitmap', lambda n: make_bitmap(int(n**0.5), int(n**0.5), 'random')),
+        ('striped_bitmap_packed', lambda n: make_bitmap_packed(int(n**0.5), int(n**0.5), 'stripes')),
+        ('random_bitmap_packed', lambda n: make_bitmap_packed(int(n**0.5), int(n**0.5), 'random',
+                                                              random.getrandbits(32))),
         ('repetitive_text', lambda n: make_text(n, True)),
         ('random_text', lambda n: make_text(n, False)),
     ]
@@ -301,30 +1385,98 @@ def phase_one():
     encoders = (
         huffman_encode,
         huffman_encode_opt,
+        huffman_encode_canonical,
+        huffman_encode_numpy,
         rle_encode,
         rle_encode_opt,
+        rle_encode_fast,
+        rle_encode_opt_fast,
+        lzss_encode_fast,
+        lzss_encode,
+        lzss_encode_best,
+        auto_encode,
+        bitrun_encode,
     )
 
     # collect benchmark results
     results = []
     for name, gen in patterns:
         for size in sizes:
+            random.seed(seed)
             data = gen(size)
+            all_bytes = len(set(data)) == 256
             for encoder in encoders:
-                in_sz, out_sz, ratio, dt = benchmark_encoder(encoder, data)
-                results.append((name, size, encoder.__name__, dt, ratio, out_sz))
+                if all_bytes and encoder in (huffman_encode, huffman_encode_opt, huffman_encode_numpy):
+                    # these keep the symbol count in one byte, so data using all
+                    # 256 byte values (packed random bitmaps) cannot be encoded
+                    print(f"{name:15s} {encoder.__name__:18s} skipped: all 256 byte values present")
+                    continue
+                row = benchmark_runner(encoder, data, repeats)
+                results.append(dict(row, datatype=name, input_size=size, encoder=encoder.__name__, seed=seed))
+                decode_ms = row['decode_ms']
+                decode_txt = f" decode={len(data) / decode_ms / 1e3:6.2f}MB/s" if decode_ms else ""
                 print(f"{name:15s} {encoder.__name__:18s} "
-                      f"{in_sz:6d}->{out_sz:6d} ratio={ratio:.2f} time={dt:7.2f}ms")
+                      f"{len(data):6d}->{row['output_size']:6d} ratio={row['ratio']:.2f} "
+                      f"time={row['time_ms']:7.2f}±{row['time_iqr_ms']:.2f}ms {row['mb_s']:7.2f}MB/s "
+                      f"peak={row['peak_kb']:7.1f}KB{decode_txt}")
 
     # build DataFrame with your desired columns
+    # (the original columns first so older readers of results.csv keep working)
     df = pd.DataFrame(
         results,
-        columns=['datatype', 'input_size', 'encoder', 'time_ms', 'ratio', 'output_size']
+        columns=['datatype', 'input_size', 'encoder', 'time_ms', 'ratio', 'output_size', 'decode_ms',
+                 'time_iqr_ms', 'mb_s', 'peak_kb', 'decode_iqr_ms', 'repeats', 'seed']
     )
 
+    # output bytes the canonical header saves over huffman_encode_opt
+    out_sizes = df.pivot_table(index=['datatype', 'input_size'], columns='encoder', values='output_size')
+    saved = (out_sizes['huffman_encode_opt'] - out_sizes['huffman_encode_canonical']).dropna()
+    print("\nhuffman_encode_canonical vs huffman_encode_opt output size:")
+    for (name, size), diff in saved.items():
+        print(f"{name:15s} {size:6d}  {int(diff):+6d} bytes saved "
+              f"({diff / out_sizes['huffman_encode_opt'][(name, size)]:.1%})")
+
+    # LZSS effort levels: ratio versus encode time, averaged over sizes
+    lz = df[df['encoder'].str.startswith('lzss')].groupby(['datatype', 'encoder'])[['ratio', 'time_ms']].mean()
+    print("\nLZSS effort levels (mean over sizes):")
+    for (name, encoder), row in lz.iterrows():
+        print(f"{name:15s} {encoder:18s} ratio={row['ratio']:.3f} time={row['time_ms']:7.2f}ms")
+
+    # auto_encode against the better of the two encoders it chooses between
+    ratios = df.pivot_table(index=['datatype', 'input_size'], columns='encoder', values='ratio')
+    best = ratios[['huffman_encode_canonical', 'rle_encode_opt']].min(axis=1)
+    print("\nauto_encode ratio vs best of huffman_encode_canonical/rle_encode_opt:")
+    for (name, size), ratio in ratios['auto_encode'].items():
+        print(f"{name:15s} {size:6d}  auto={ratio:.3f} best={best[(name, size)]:.3f}")
+
+    # same bitmaps one byte per pixel vs packed: smallest output and its encode time
+    print("\nbyte-per-pixel vs packed bitmaps (best encoder for each):")
+    for name in ('striped_bitmap', 'random_bitmap'):
+        for size in sizes:
+            cells = []
+            for datatype in (name, name + '_packed'):
+                rows = df[(df['datatype'] == datatype) & (df['input_size'] == size)]
+                best_row = rows.loc[rows['output_size'].idxmin()]
+                cells.append(f"{best_row['encoder']:24s} {int(best_row['output_size']):6d}B "
+                             f"{best_row['time_ms']:7.2f}ms")
+            print(f"{name:15s} {size:6d}  {cells[0]}  |  packed {cells[1]}")
+
     # write it out
     df.to_csv('results.csv', index=False)
-    print("Wrote results.csv with columns: datatype,input_size,encoder,time_ms,ratio,output_size")
+    print(f"Wrote results.csv with columns: {','.join(df.columns)}")
 
 if __name__ == '__main__':
-    phase_one()
+    parser = argparse.ArgumentParser(description='Benchmark the Huffman and RLE encoders.')
+    parser.add_argument('--block-scaling', type=int, metavar='MB',
+                        help='Instead benchmark the block container on MB of text across core counts')
+    parser.add_argument('--repeats', type=int, default=BENCH_REPEATS,
+                        help='Timed trials per encoder and dataset (median and IQR are reported)')
+    parser.add_argument('--seed', type=int, default=BENCH_SEED,
+                        help='Seed for the generated datasets')
+    args = parser.parse_args()
+    if args.repeats < 1:
+        parser.error('--repeats must be at least 1')
+    if args.block_scaling:
+        benchmark_block_scaling(make_text(args.block_scaling << 20))
+    else:
+        phase_one(args.repeats, args.seed)
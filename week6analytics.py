@@ -1,7 +1,11 @@
 import argparse
+import sys
 import pandas as pd
 import matplotlib.pyplot as plt
 
+# rows of two runs are matched on these columns
+RUN_KEY = ['datatype', 'input_size', 'encoder']
+
 def load_data(csv_path):
     """
     Load CSV data into a pandas DataFrame.
@@ -59,14 +63,81 @@ def compare_encoders(df):
     print(summary.to_string(index=False))
 
 
+def find_regressions(baseline, candidate, time_threshold=0.10, ratio_threshold=0.01):
+    """
+    Align two runs on RUN_KEY and return the rows that regressed.
+    A slowdown counts when time_ms grows by more than time_threshold (relative)
+    and, when both runs have time_iqr_ms, by more than the two IQRs combined, so
+    noise within the spread of the trials is not reported. A ratio change counts
+    when the compression ratio moves by more than ratio_threshold (relative) in
+    either direction. Encoders missing from the candidate are reported too.
+    """
+    merged = baseline.merge(candidate, on=RUN_KEY, how='left', suffixes=('_base', '_cand'),
+                            indicator=True)
+    merged['time_change'] = merged['time_ms_cand'] / merged['time_ms_base'] - 1
+    merged['ratio_change'] = merged['ratio_cand'] / merged['ratio_base'] - 1
+
+    slower = merged['time_change'] > time_threshold
+    if 'time_iqr_ms_base' in merged and 'time_iqr_ms_cand' in merged:
+        spread = merged['time_iqr_ms_base'].fillna(0) + merged['time_iqr_ms_cand'].fillna(0)
+        slower &= merged['time_ms_cand'] - merged['time_ms_base'] > spread
+    ratio_moved = merged['ratio_change'].abs() > ratio_threshold
+    missing = merged['_merge'] == 'left_only'
+
+    merged['issue'] = ''
+    merged.loc[slower, 'issue'] = 'slowdown'
+    merged.loc[ratio_moved, 'issue'] = (merged.loc[ratio_moved, 'issue'] + ' ratio').str.strip()
+    merged.loc[missing, 'issue'] = 'missing'
+    columns = RUN_KEY + ['issue', 'time_ms_base', 'time_ms_cand', 'time_change',
+                         'ratio_base', 'ratio_cand', 'ratio_change']
+    return merged.loc[merged['issue'] != '', columns].reset_index(drop=True)
+
+
+def write_regression_report(regressions, path=None):
+    """
+    Print the regressions as a text table and, if path is given, also save
+    them (HTML for a .html path, plain text otherwise).
+    """
+    if regressions.empty:
+        text = "No regressions found."
+    else:
+        text = f"{len(regressions)} regression(s):\n" + regressions.to_string(
+            index=False, float_format=lambda v: f"{v:.4g}")
+    print(text)
+    if path:
+        with open(path, 'w') as f:
+            if path.endswith('.html'):
+                f.write(regressions.to_html(index=False, float_format=lambda v: f"{v:.4g}"))
+            else:
+                f.write(text + "\n")
+        print(f"Saved regression report: {path}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Analyze compression data: runtime and efficiency comparisons.'
     )
-    parser.add_argument('csv_path', help='Path to the CSV data file')
+    parser.add_argument('csv_path', nargs='?', help='Path to the CSV data file')
     parser.add_argument('--output-prefix', help='Prefix for saved chart filenames', default=None)
+    parser.add_argument('--baseline', help='Baseline results CSV; with --candidate, check for regressions')
+    parser.add_argument('--candidate', help='Candidate results CSV to compare against --baseline')
+    parser.add_argument('--time-threshold', type=float, default=0.10,
+                        help='Relative time_ms increase counted as a slowdown (default 0.10)')
+    parser.add_argument('--ratio-threshold', type=float, default=0.01,
+                        help='Relative compression ratio change counted as a regression (default 0.01)')
+    parser.add_argument('--report', help='Also write the regression report here (.html or text)')
     args = parser.parse_args()
 
+    if args.baseline or args.candidate:
+        if not (args.baseline and args.candidate):
+            parser.error('--baseline and --candidate must be given together')
+        regressions = find_regressions(load_data(args.baseline), load_data(args.candidate),
+                                       args.time_threshold, args.ratio_threshold)
+        write_regression_report(regressions, args.report)
+        sys.exit(1 if len(regressions) else 0)
+    if not args.csv_path:
+        parser.error('csv_path is required unless --baseline and --candidate are given')
+
     df = load_data(args.csv_path)
 
     compare_encoders(df)
@@ -0,0 +1,150 @@
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+
+from week6 import BLOCK_CODECS, DECODERS, WRITABLE_CODECS, huffman_encode_canonical
+
+# stream layout: magic, codec id (same ids as the week6 block container),
+# then one (raw length, payload length) frame header per buffer
+STREAM_MAGIC = b"HSTR"
+STREAM_HEADER = struct.Struct(">4sB")
+FRAME = struct.Struct(">II")
+STREAM_BUFFER = 1 << 20
+# the CLI only writes WRITABLE_CODECS; decompress accepts every block codec
+ENCODERS = {encoder.__name__: encoder for encoder in WRITABLE_CODECS}
+
+
+def _buffers(src, buffer_size):
+    """
+    Yield memoryviews over consecutive buffer_size pieces of src.
+    Regular files are memory-mapped and sliced, other streams (stdin, pipes) are
+    read with readinto into one reused buffer, so no piece is copied. Each view
+    is only valid until the next one is requested.
+    """
+    try:
+        size = os.fstat(src.fileno()).st_size if src.seekable() else 0
+    except (AttributeError, OSError):
+        size = 0
+    if size:
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for start in range(0, size, buffer_size):
+                    piece = view[start:start + buffer_size]
+                    yield piece
+                    piece.release()
+            finally:
+                view.release()
+        return
+    buf = bytearray(buffer_size)
+    view = memoryview(buf)
+    while True:
+        filled = 0
+        while filled < buffer_size:
+            n = src.readinto(view[filled:])
+            if not n:
+                break
+            filled += n
+        if not filled:
+            return
+        yield view[:filled]
+        if filled < buffer_size:
+            return
+
+
+def compress_stream(src, dst, encoder=huffman_encode_canonical, buffer_size=STREAM_BUFFER):
+    """
+    Compress a binary stream buffer by buffer, so memory stays bounded by
+    buffer_size whatever the input size. Returns (bytes read, bytes written).
+    """
+    if encoder not in WRITABLE_CODECS:
+        raise ValueError(f"{encoder.__name__} cannot be used in a compressed stream")
+    dst.write(STREAM_HEADER.pack(STREAM_MAGIC, BLOCK_CODECS.index(encoder)))
+    read, written = 0, STREAM_HEADER.size
+    for piece in _buffers(src, buffer_size):
+        payload = encoder(piece)
+        dst.write(FRAME.pack(len(piece), len(payload)))
+        dst.write(payload)
+        read += len(piece)
+        written += FRAME.size + len(payload)
+    return read, written
+
+
+def decompress_stream(src, dst):
+    """
+    Reverse of compress_stream, one frame at a time. Returns (bytes read, bytes written).
+    """
+    header = src.read(STREAM_HEADER.size)
+    if len(header) < STREAM_HEADER.size:
+        raise ValueError("not a compressed stream")
+    magic, codec = STREAM_HEADER.unpack(header)
+    if magic != STREAM_MAGIC or codec >= len(BLOCK_CODECS):
+        raise ValueError("not a compressed stream")
+    decoder = DECODERS[BLOCK_CODECS[codec].__name__]
+    read, written = STREAM_HEADER.size, 0
+    while True:
+        frame = src.read(FRAME.size)
+        if not frame:
+            return read, written
+        if len(frame) < FRAME.size:
+            raise ValueError("truncated frame header")
+        raw_len, payload_len = FRAME.unpack(frame)
+        payload = src.read(payload_len)
+        if len(payload) < payload_len:
+            raise ValueError("truncated frame")
+        out = decoder(payload)
+        if len(out) != raw_len:
+            raise ValueError("frame decoded to the wrong length")
+        dst.write(out)
+        read += FRAME.size + payload_len
+        written += raw_len
+
+
+def _open(path, mode):
+    if path == "-":
+        return (sys.stdin if "r" in mode else sys.stdout).buffer
+    return open(path, mode)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Stream-compress files with the week6 encoders in bounded memory.'
+    )
+    parser.add_argument('mode', choices=['compress', 'decompress'])
+    parser.add_argument('input', help="Input file, or - for stdin")
+    parser.add_argument('output', help="Output file, or - for stdout")
+    parser.add_argument('--encoder', choices=sorted(ENCODERS), default=huffman_encode_canonical.__name__)
+    parser.add_argument('--buffer-size', type=int, default=STREAM_BUFFER, help='Bytes per frame')
+    args = parser.parse_args()
+
+    src = _open(args.input, "rb")
+    dst = _open(args.output, "wb")
+    t0 = time.perf_counter()
+    try:
+        if args.mode == 'compress':
+            read, written = compress_stream(src, dst, ENCODERS[args.encoder], args.buffer_size)
+            raw = read
+        else:
+            read, written = decompress_stream(src, dst)
+            raw = written
+    except Exception:
+        # do not leave a truncated output file behind
+        if dst is not sys.stdout.buffer:
+            dst.close()
+            os.remove(args.output)
+        raise
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+        if dst is not sys.stdout.buffer:
+            dst.close()
+    dt = time.perf_counter() - t0
+    print(f"{args.mode}ed {read} -> {written} bytes in {dt:.2f}s "
+          f"({raw / 1e6 / dt if dt else float('inf'):.2f} MB/s)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()